@@ -0,0 +1,297 @@
+#!/usr/bin/python3
+#
+# bench_tracer.py
+#
+#    Copyright (C) 2014 Arthur Bouton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#    The author of this code can be contacted at arthur.bouton@gadz.org
+#    Any contact about this application is warmly welcomed.
+#
+"""
+End-to-end benchmark of the tracer, fed by synthetic streams and rendered headlessly.
+
+Each configuration of the matrix (number of columns, layout of the series, band and abscissa)
+is run at increasing line rates, each run in its own process so that its peak memory is its own.
+The first column of the lines is the time at which they were sent, which gives the latency of the display.
+
+For each run are reported the achieved line rate, the proportion of frames drawn while the reading was behind,
+the percentiles of the redraw time and of the latency, the peak RSS and the CPU time
+of the reading thread, of the rendering thread, of the other threads and of the worker process if any.
+The sustained rate of a configuration is the highest achieved rate with almost no such frame.
+
+The results are written as JSON, along with the commit they were obtained at.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+
+
+REPOSITORY = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+
+# PROPORTION DE TRAMES EN RETARD AU-DELÀ DE LAQUELLE LE DÉBIT N'EST PLUS TENU :
+OVERRUN_TOLERANCE = 0.05
+
+# PÉRIODE D'ENVOI DES LIGNES :
+PERIOD = 0.01
+
+
+def _layout( name, ncolumns ) :
+	"Return the -C option corresponding to a layout of the series."
+
+	if name == 'auto' :
+		return ''
+	if name == 'pair' :
+		return '-C 1,2'
+	if name == 'split' :
+		half = max( 1, ncolumns//2 )
+		first = '1:%i' % half if half > 1 else '1'
+		second = '%i:%i' % ( half + 1, ncolumns ) if ncolumns > half + 1 else str( ncolumns )
+		return '-C %s/%s' % ( first, second )
+	raise ValueError( "unknown layout: '%s'" % name )
+
+
+def _percentiles( values ) :
+
+	if not values :
+		return None
+	return { 'p50': float( np.percentile( values, 50 ) ),
+	         'p90': float( np.percentile( values, 90 ) ),
+	         'p99': float( np.percentile( values, 99 ) ),
+	         'max': float( np.max( values ) ) }
+
+
+def _generate( fd, ncolumns, rate, duration ) :
+	"Write lines of 'ncolumns' numbers at 'rate' lines per second during 'duration' seconds, the first one being the time."
+
+	rng = np.random.default_rng( 0 )
+	values = np.cumsum( rng.standard_normal( ( 4096, ncolumns - 1 ) ), axis=0 )
+	lines = [ b' '.join( b'%.4f' % value for value in row ) for row in values ]
+
+	count = max( 1, int( rate*PERIOD ) )
+	period = count/rate
+	position = 0
+
+	end = time.monotonic() + duration
+	deadline = time.monotonic()
+	while deadline < end :
+
+		batch = lines[position:position+count]
+		while len( batch ) < count :
+			batch += lines[:count-len( batch )]
+		position = ( position + count )%len( lines )
+
+		stamp = b'%.6f ' % time.monotonic()
+		block = stamp + ( b'\n' + stamp ).join( batch ) + b'\n'
+		view = memoryview( block )
+		while view :
+			view = view[os.write( fd, view ):]
+
+		deadline += period
+		delay = deadline - time.monotonic()
+		if delay > 0 :
+			time.sleep( delay )
+
+	os.close( fd )
+
+
+def run_case( case ) :
+	"Run the tracer on a synthetic stream described by the dictionary 'case' and return its measures."
+
+	import resource
+	sys.path.insert( 0, REPOSITORY )
+	from tracer import Tracer
+
+	read_fd, write_fd = os.pipe()
+
+	generator = os.fork()
+	if generator == 0 :
+		os.close( read_fd )
+		try :
+			_generate( write_fd, case['ncolumns'], case['rate'], case['duration'] )
+		finally :
+			os._exit( 0 )
+	os.close( write_fd )
+
+	directory = tempfile.mkdtemp()
+	output = os.path.join( directory, 'frame.png' )
+
+	# LES COULEURS BOUCLENT SUR CHAQUE GRAPHIQUE, CE QUI N'INFLUE PAS SUR LES MESURES :
+	args = '-q -l --out %s %s' % ( output, case['args'] )
+	tracer = Tracer( args=args, input=os.fdopen( read_fd, 'rb', buffering=0 ) )
+
+
+	# INSTRUMENTATION :
+
+	redraws = []
+	latencies = []
+	reader_cpu = [ 0. ]
+
+	redraw_data = tracer.redraw_data
+	def timed_redraw( msg='' ) :
+		store = tracer._sources[0].store
+		stamp = store.series( 0 )[-1] if store is not None and len( store ) > 0 else None
+		start = time.perf_counter()
+		redraw_data( msg )
+		redraws.append( time.perf_counter() - start )
+		if stamp is not None :
+			latencies.append( time.monotonic() - stamp )
+	tracer.redraw_data = timed_redraw
+
+	read_data = tracer._read_data
+	def timed_read() :
+		start = time.thread_time()
+		try :
+			read_data()
+		finally :
+			reader_cpu[0] += time.thread_time() - start
+	tracer._read_data = timed_read
+
+
+	# EXÉCUTION :
+
+	start = time.monotonic()
+	main_cpu = time.thread_time()
+	tracer.run( show=False, fork=False )
+	main_cpu = time.thread_time() - main_cpu
+	wall = time.monotonic() - start
+
+	usage = resource.getrusage( resource.RUSAGE_SELF )
+	children = os.times()
+	worker_cpu = children.children_user + children.children_system
+
+	os.waitpid( generator, 0 )
+
+	total = sum( source.store._total for source in tracer._sources if source.store is not None )
+	process_cpu = usage.ru_utime + usage.ru_stime
+
+	for name in os.listdir( directory ) :
+		os.unlink( os.path.join( directory, name ) )
+	os.rmdir( directory )
+
+	return { 'lines': int( total ),
+	         'lines_per_s': total/case['duration'],
+	         'wall_s': wall,
+	         'frames': len( redraws ),
+	         'overrun_frames': tracer._overruns,
+	         'overrun_ratio': tracer._overruns/len( redraws ) if redraws else 0.,
+	         'redraw_ms': _percentiles( [ 1e3*t for t in redraws ] ),
+	         'latency_ms': _percentiles( [ 1e3*t for t in latencies ] ),
+	         'peak_rss_kb': usage.ru_maxrss,
+	         'cpu_s': { 'reader': reader_cpu[0],
+	                    'render': main_cpu,
+	                    'other_threads': max( 0., process_cpu - reader_cpu[0] - main_cpu ),
+	                    'worker': worker_cpu } }
+
+
+def _run_in_process( case ) :
+
+	output = subprocess.run( [ sys.executable, os.path.abspath( __file__ ), '--case', json.dumps( case ) ],
+	                         stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False )
+	lines = output.stdout.decode( errors='replace' ).strip().splitlines()
+	if output.returncode != 0 or not lines :
+		return { 'error': output.stderr.decode( errors='replace' ).strip().splitlines()[-1:] }
+	return json.loads( lines[-1] )
+
+
+def _metadata() :
+
+	import matplotlib
+
+	def git( *args ) :
+		try :
+			return subprocess.run( [ 'git', '-C', REPOSITORY ] + list( args ), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True ).stdout.decode().strip()
+		except ( OSError, subprocess.CalledProcessError ) :
+			return None
+
+	return { 'commit': git( 'rev-parse', 'HEAD' ),
+	         'dirty': bool( git( 'status', '--porcelain', '--untracked-files=no' ) ),
+	         'date': time.strftime( '%Y-%m-%dT%H:%M:%S%z' ),
+	         'python': platform.python_version(),
+	         'numpy': np.__version__,
+	         'matplotlib': matplotlib.__version__,
+	         'platform': platform.platform(),
+	         'cpus': os.cpu_count() }
+
+
+def main() :
+
+	parser = argparse.ArgumentParser( description="Benchmark the tracer over a matrix of synthetic streams and write the results as JSON." )
+	parser.add_argument( '--rates', type=lambda arg : [ int( float( x ) ) for x in arg.split( ',' ) ], default=[ 10000, 100000, 1000000 ], help="line rates to try in increasing order, separated by commas" )
+	parser.add_argument( '--columns', type=lambda arg : [ int( x ) for x in arg.split( ',' ) ], default=[ 2, 8, 32 ], help="numbers of columns, separated by commas" )
+	parser.add_argument( '--layouts', type=lambda arg : arg.split( ',' ), default=[ 'auto', 'pair', 'split' ], help="layouts of the series among 'auto' (no -C), 'pair' (-C 1,2) and 'split' (two subplots), separated by commas" )
+	parser.add_argument( '--bands', type=lambda arg : [ int( x ) for x in arg.split( ',' ) ], default=[ 1000, 100000 ], help="bands, separated by commas" )
+	parser.add_argument( '--abscissa', choices=[ 'off', 'on', 'both' ], default='both', help="run without -a, with it or both" )
+	parser.add_argument( '--duration', type=float, default=3., help="duration of each run in seconds" )
+	parser.add_argument( '--extra', type=str, default='', help="additional options for the tracer, like '--workers' or '--blit'" )
+	parser.add_argument( '--quick', action='store_true', help="run a reduced matrix" )
+	parser.add_argument( '-o', '--output', type=str, default='bench.json', help="file where to write the results" )
+	parser.add_argument( '--case', type=json.loads, help=argparse.SUPPRESS )
+	args = parser.parse_args()
+
+	if args.case is not None :
+		print( json.dumps( run_case( args.case ) ) )
+		return
+
+	if args.quick :
+		args.columns, args.layouts, args.bands, args.abscissa = [ 8 ], [ 'auto', 'split' ], [ 1000 ], 'off'
+
+	abscissa = { 'off': [ False ], 'on': [ True ], 'both': [ False, True ] }[args.abscissa]
+
+	results = { 'metadata': _metadata(), 'duration_s': args.duration, 'extra': args.extra, 'configurations': [] }
+
+	for ncolumns, layout, band, a in itertools.product( args.columns, args.layouts, args.bands, abscissa ) :
+
+		options = ' '.join( option for option in ( _layout( layout, ncolumns ), '-b %i' % band, '-a' if a else '', args.extra ) if option )
+		configuration = { 'columns': ncolumns, 'layout': layout, 'band': band, 'abscissa': a, 'args': options, 'runs': [], 'sustained_lines_per_s': 0. }
+
+		for rate in sorted( args.rates ) :
+
+			sys.stderr.write( '%-40s %9i lines/s ... ' % ( options, rate ) )
+			sys.stderr.flush()
+
+			measures = _run_in_process( { 'ncolumns': ncolumns, 'rate': rate, 'duration': args.duration, 'args': options } )
+			measures['rate'] = rate
+			configuration['runs'].append( measures )
+
+			if 'error' in measures :
+				sys.stderr.write( 'error: %s\n' % ' '.join( measures['error'] ) )
+				break
+
+			sys.stderr.write( '%9i lines/s, %3i%% overrun, redraw p50 %.1f ms\n' % ( measures['lines_per_s'], 100*measures['overrun_ratio'],
+			                  measures['redraw_ms']['p50'] if measures['redraw_ms'] else float( 'nan' ) ) )
+
+			kept_up = measures['lines_per_s'] >= 0.95*rate
+			if kept_up and measures['overrun_ratio'] <= OVERRUN_TOLERANCE :
+				configuration['sustained_lines_per_s'] = max( configuration['sustained_lines_per_s'], measures['lines_per_s'] )
+			if not kept_up :
+				break
+
+		results['configurations'].append( configuration )
+
+	with open( args.output, 'w' ) as f :
+		json.dump( results, f, indent=1 )
+	sys.stderr.write( 'Results written to %s\n' % args.output )
+
+
+if __name__ == '__main__' :
+	main()
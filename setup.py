@@ -12,5 +12,6 @@ setup(
 	py_modules=[ 'tracer', 'tracer_qt4', 'tracer_tk' ],
 	entry_points={ 'console_scripts':
 		[ 'tracer=tracer:main', 'tracer-qt4=tracer_qt4:main', 'tracer-tk=tracer_tk:main' ] },
-	install_requires=[ 'matplotlib>=1.5.1' ]
+	python_requires='>=3.9',
+	install_requires=[ 'matplotlib>=2.1', 'numpy>=1.19' ]
 )
@@ -0,0 +1,401 @@
+#!/usr/bin/python3
+#
+# test_tracer.py
+#
+#    Copyright (C) 2014 Arthur Bouton
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#    The author of this code can be contacted at arthur.bouton@gadz.org
+#    Any contact about this application is warmly welcomed.
+#
+"""
+Checks of the block parser, of the extrema structures, of the decimation,
+of the binary record formats and of write_data, run with pytest.
+"""
+import io
+import os
+import re
+import struct
+import sys
+import numpy as np
+import pytest
+
+REPOSITORY = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+sys.path.insert( 0, REPOSITORY )
+
+import tracer
+from tracer import Tracer, _SlidingExtremum, _Pyramid, write_data
+
+
+@pytest.fixture
+def make_tracer( tmp_path, monkeypatch ) :
+	"Return a function creating a tracer reading an empty file with the given options."
+
+	path = tmp_path/'input'
+	path.touch()
+
+	def make( args='' ) :
+		# LE TRACEUR REMPLACE sys.stdout PAR UN OBJET QUI FERMERA LE DESCRIPTEUR QU'IL LUI DONNE :
+		monkeypatch.setattr( sys, 'stdout', open( os.dup( 1 ), 'w', closefd=False ) )
+		return Tracer( '-f %s %s' % ( path, args ) )
+
+	return make
+
+
+@pytest.fixture
+def written( monkeypatch ) :
+	"Collect what is written on the standard output by _write_out."
+
+	parts = []
+	monkeypatch.setattr( tracer, '_write_out', lambda output : parts.extend( bytes( part ) for part in output ) )
+	return parts
+
+
+def _is_number( word ) :
+	try :
+		float( word )
+		return True
+	except ValueError :
+		return False
+
+
+def _parse_lines( lines, sep=None, ncolumns=None, columns=None, offset=None, quiet=False, reprint=False ) :
+	"""
+	Parse the lines one by one as the first versions of the tracer did.
+	Return the list of the rows and the list of the lines written on the standard output.
+	"""
+
+	rows = []
+	output = []
+
+	for strline in lines :
+		line = strline.split( sep )
+
+		if offset :
+			offset -= 1
+			accepted = None
+		elif ncolumns is not None and len( line ) != ncolumns :
+			accepted = False
+		elif columns is None :
+			columns = [ i + 1 for i, word in enumerate( line ) if _is_number( word ) ] or None
+			accepted = columns is not None
+		else :
+			accepted = len( line ) >= max( columns ) and all( _is_number( line[serie-1] ) for serie in columns )
+
+		if accepted :
+			rows.append( [ float( line[serie-1] ) for serie in columns ] )
+		if accepted and reprint or not accepted and not quiet :
+			output.append( strline )
+
+	return rows, output
+
+
+LINES = {
+	'uniform' : [ '%i %g %g\n' % ( i, i/7, -i*3.5 ) for i in range( 200 ) ],
+	'header' : [ 'time position speed\n', '# units: s m m/s\n' ] + [ '%i\t%g\t%g\n' % ( i, i**.5, -i ) for i in range( 50 ) ],
+	'mixed' : [ '%i %i %i\n' % ( i, 2*i, 3*i ) if i % 3 else '%i %i\n' % ( i, i ) if i % 2 else 'error at %i ms\n' % i for i in range( 120 ) ],
+	'unterminated' : [ '%i %i\n' % ( i, -i ) for i in range( 30 ) ] + [ '30 -30' ],
+	'separator' : [ '%i,%g,%g\n' % ( i, i/3, i*i ) for i in range( 100 ) ] + [ 'a,b\n', '1,2,x\n', '7,8,9\n' ],
+}
+
+CASES = [
+	( 'uniform', {} ),
+	( 'uniform', { 'columns': [ 3, 1 ] } ),
+	( 'uniform', { 'offset': 5 } ),
+	( 'header', {} ),
+	( 'header', { 'ncolumns': 3 } ),
+	( 'mixed', {} ),
+	( 'mixed', { 'ncolumns': 2 } ),
+	( 'mixed', { 'columns': [ 2 ] } ),
+	( 'unterminated', {} ),
+	( 'separator', { 'sep': ',' } ),
+	( 'separator', { 'sep': ',', 'columns': [ 1, 3 ] } ),
+]
+
+
+@pytest.mark.parametrize( 'quiet', [ False, True ] )
+@pytest.mark.parametrize( 'reprint', [ False, True ] )
+@pytest.mark.parametrize( 'name, options', CASES )
+def test_parse_block( make_tracer, written, name, options, quiet, reprint ) :
+	"The block parser accepts the same lines, with the same values, and writes the same lines as the per-line parser."
+
+	lines = LINES[name]
+	args = [ '-q' ]*quiet + [ '-p' ]*reprint
+	if 'sep' in options :
+		args.append( '--sep=%s' % options['sep'] )
+	if 'ncolumns' in options :
+		args.append( '-n%i' % options['ncolumns'] )
+	if 'columns' in options :
+		args.append( '-C%s' % ','.join( map( str, options['columns'] ) ) )
+	if 'offset' in options :
+		args.append( '-o%i' % options['offset'] )
+
+	expected_rows, expected_output = _parse_lines( lines, quiet=quiet, reprint=reprint, **options )
+
+	# LES LIGNES SONT DONNÉES EN DEUX BLOCS POUR QUE LES SÉRIES SOIENT DÉTECTÉES DANS LE PREMIER :
+	t = make_tracer( ' '.join( args ) )
+	source = t._sources[0]
+	middle = len( lines )//3
+	blocks = [ ''.join( lines[:middle] ).encode(), ''.join( lines[middle:] ).encode() ]
+	rows = [ t._parse_block( source, block ) for block in blocks ]
+	rows = np.concatenate( [ r for r in rows if r is not None ] )
+
+	assert np.array_equal( rows, np.array( expected_rows ) )
+	assert b''.join( written ) == ''.join( expected_output ).encode()
+
+
+def test_parse_block_limit( make_tracer, written ) :
+	"Only the lines up to the limit-th accepted one are parsed and written."
+
+	lines = LINES['mixed']
+	t = make_tracer( '-p' )
+	rows = t._parse_block( t._sources[0], ''.join( lines ).encode(), limit=10 )
+
+	expected_rows, accepted_lines = _parse_lines( lines, quiet=True, reprint=True )
+	assert np.array_equal( rows, np.array( expected_rows[:10] ) )
+	assert b''.join( written ) == ''.join( lines[:lines.index( accepted_lines[9] )+1] ).encode()
+
+
+@pytest.mark.parametrize( 'maximum', [ False, True ] )
+def test_sliding_extremum( maximum ) :
+	"The extremum of the last values is the one of a brute-force search, NaNs being ignored."
+
+	rng = np.random.default_rng( 0 )
+	series = rng.integers( -50, 50, 5000 ).astype( float )
+	series[rng.random( len( series ) ) < 0.05] = np.nan
+	series[1000:1100] = np.nan
+
+	windows = ( 1, 37, 150, 1000 )
+	extrema = [ _SlidingExtremum( maximum, capacity=4 ) for window in windows ]
+	reduce = np.nanmax if maximum else np.nanmin
+	position = 0
+	while position < len( series ) :
+		size = int( rng.integers( 1, 200 ) )
+		for window, extremum in zip( windows, extrema ) :
+			extremum.extend( series[position:position+size], position )
+			start = max( 0, position + size - window )
+			extremum.evict( start )
+			expected = series[start:position+size]
+			if np.isnan( expected ).all() :
+				assert extremum.value() is None
+			else :
+				assert extremum.value() == reduce( expected )
+		position += size
+
+
+@pytest.mark.parametrize( 'band', [ None, 37 ] )
+def test_ring_buffer_sorted( band ) :
+	"Whether the first series is sorted is the answer of a brute-force check, evicted data being forgotten."
+
+	rng = np.random.default_rng( 0 )
+	store = tracer._RingBuffer( 1, band=band, capacity=4 )
+	last = 0.
+	for step in range( 500 ) :
+		size = int( rng.integers( 0, 6 ) )
+		block = last + np.cumsum( rng.random( size ) )
+		if size > 0 and rng.random() < 0.05 :
+			block[rng.integers( size )] -= 5
+		if size > 0 and rng.random() < 0.02 :
+			block[rng.integers( size )] = np.nan
+		if size > 0 and not np.isnan( block[-1] ) :
+			last = block[-1]
+		store.extend( block.reshape( size, 1 ) )
+		series = store.series( 0 )
+		assert store.sorted == bool( np.all( series[1:] >= series[:-1] ) )
+
+
+def test_pyramid( monkeypatch ) :
+	"Each level holds the extrema of its blocks and their positions, whatever the chunks of the first level."
+
+	monkeypatch.setattr( _Pyramid, 'CHUNK', 1 << 12 )
+
+	rng = np.random.default_rng( 1 )
+	series = rng.standard_normal( 300000 )
+	pyramid = _Pyramid( series )
+
+	assert len( pyramid.levels ) == 3
+	size = _Pyramid.BASE
+	for minima, maxima, lowest, highest in pyramid.levels :
+		blocks = series[:len( series )//size*size].reshape( -1, size )
+		assert np.array_equal( minima, blocks.min( 1 ) )
+		assert np.array_equal( maxima, blocks.max( 1 ) )
+		assert np.array_equal( lowest, blocks.argmin( 1 ) + np.arange( 0, len( blocks )*size, size ) )
+		assert np.array_equal( highest, blocks.argmax( 1 ) + np.arange( 0, len( blocks )*size, size ) )
+		size *= _Pyramid.FACTOR
+
+	level, size = pyramid.level( 100 )
+	assert size == 64 and level is pyramid.levels[1]
+	level, size = pyramid.level( 10 )
+	assert size == 16 and level is pyramid.levels[0]
+	level, size = pyramid.level( 10**6 )
+	assert size == 256 and level is pyramid.levels[2]
+
+
+@pytest.mark.parametrize( 'dtype', [ np.float64, np.int64 ] )
+@pytest.mark.parametrize( 'xlim', [ ( -1e9, 1e9 ), ( 12345.5, 250000.2 ), ( 1000, 1500 ) ] )
+@pytest.mark.parametrize( 'pyramid', [ False, True ] )
+def test_decimate( make_tracer, dtype, xlim, pyramid ) :
+	"The decimated points are points of the series, in their order, and keep the extrema of the view."
+
+	rng = np.random.default_rng( 2 )
+	n = 300000
+	x = np.arange( n ).astype( dtype )*( 2 if dtype == np.int64 else 0.5 )
+	y = np.cumsum( rng.standard_normal( n ) )
+	width = 200
+
+	t = make_tracer()
+	dx, dy = t._decimate( x, y, xlim, width, _Pyramid( y ) if pyramid else None )
+
+	indexes = np.searchsorted( x, dx )
+	assert np.array_equal( x[indexes], dx )
+	assert np.array_equal( y[indexes], dy )
+	assert ( np.diff( indexes ) >= 0 ).all()
+
+	# LE PAS EST ARRONDI PAR DÉFAUT ET LES POINTS QUI NE FORMENT PAS UN BLOC COMPLET AUX BORDS DE LA VUE SONT GARDÉS TELS QUELS :
+	inside = ( x >= xlim[0] ) & ( x <= xlim[1] )
+	if inside.sum() > 4*width :
+		assert len( dx ) <= 8*width + 3*inside.sum()//( 2*width ) + 4
+		view = ( dx >= xlim[0] ) & ( dx <= xlim[1] )
+		assert dy[view].min() == y[inside].min()
+		assert dy[view].max() == y[inside].max()
+	else :
+		assert len( dx ) <= inside.sum() + 2
+
+
+def test_decimate_paths( make_tracer ) :
+	"The pyramid gives the same points as the direct search when their blocks are aligned."
+
+	rng = np.random.default_rng( 3 )
+	y = rng.standard_normal( 1 << 18 )
+	x = np.arange( len( y ) )
+
+	t = make_tracer()
+	direct = t._decimate( x, y, ( 1, len( y ) - 2 ), 256 )
+	aligned = t._decimate( x, y, ( 1, len( y ) - 2 ), 256, _Pyramid( y ) )
+	assert np.array_equal( direct[0], aligned[0] )
+	assert np.array_equal( direct[1], aligned[1] )
+
+
+def _struct_values( rng, prefix, codes, count ) :
+	"Return random values for 'count' records of the struct codes."
+
+	values = []
+	for i in range( count ) :
+		for code in codes :
+			size = struct.calcsize( prefix + code )
+			if code in 'bhilqn' :
+				values.append( int( rng.integers( -2**( 8*size - 1 ), 2**( 8*size - 1 ) ) ) )
+			elif code in 'BHILQN' :
+				values.append( int( rng.integers( 0, 2**( 8*size ), dtype=np.uint64 ) ) )
+			elif code == '?' :
+				values.append( bool( rng.integers( 2 ) ) )
+			elif code == 'c' :
+				values.append( b'z' )
+			elif code in 'efd' :
+				values.append( float( rng.integers( -1000, 1000 ) )/8 )
+	return values
+
+
+@pytest.mark.parametrize( 'fmt', [ '<2l', '>hL', '!iIbB', '<qQ', '>q', '@lLn', '@N', '=e2f', '>?xh', '<cxd', 'bi', '@hq', '<3d', '=Hb' ] )
+def test_record_format( make_tracer, fmt ) :
+	"The fields of a struct format are read as struct.unpack reads them."
+
+	t = make_tracer()
+	dtype = t._record_format( fmt )
+	assert dtype.itemsize == struct.calcsize( fmt )
+
+	prefix = fmt[0] if fmt[0] in '@=<>!' else ''
+	codes = ''.join( code*int( count or 1 ) for count, code in re.findall( r'(\d*)(\D)', fmt[len( prefix ):] ) )
+	buffer = struct.pack( prefix + codes*5, *_struct_values( np.random.default_rng( 4 ), prefix, codes.replace( 'x', '' ), 5 ) )
+
+	records = np.frombuffer( buffer, dtype )
+	expected = list( struct.iter_unpack( fmt, buffer ) )
+	for record, values in zip( records, expected ) :
+		values = [ value for value in values if not isinstance( value, bytes ) ]
+		assert [ record[name] for name in dtype.names ] == values
+
+
+def test_record_types( make_tracer ) :
+	"The fields of a list of types are packed one after the other in the native byte order."
+
+	t = make_tracer()
+	dtype = t._record_format( 'i32,f32x2,u8,f64' )
+	assert dtype.itemsize == 4 + 8 + 1 + 8
+	assert [ dtype.fields[name][1] for name in dtype.names ] == [ 0, 4, 8, 12, 13 ]
+	assert [ dtype.fields[name][0] for name in dtype.names ] == [ np.dtype( code ) for code in ( '=i4', '=f4', '=f4', '=u1', '=f8' ) ]
+
+	for fmt in ( 'f8', 'i12', '<2z', '' ) :
+		with pytest.raises( Exception ) :
+			t._record_format( fmt )
+
+
+def _read_back( path ) :
+	"Return the arrays of each input written by write_data into the file 'path'."
+
+	extension = os.path.splitext( path )[1]
+	with open( path, 'rb' ) as f :
+		if extension == '.npz' :
+			archive = np.load( f )
+			return [ archive['input%i' % k] for k in range( len( archive.files ) ) ]
+		content = f.read()
+
+	if extension == '.npy' :
+		f = io.BytesIO( content )
+		arrays = []
+		while f.tell() < len( content ) :
+			arrays.append( np.load( f ) )
+		return arrays
+
+	if extension in ( '.raw', '.bin' ) :
+		arrays = []
+		while content :
+			assert content[:8] == b'TRACER64'
+			n, nseries = struct.unpack( '<QI', content[8:20] )
+			arrays.append( np.frombuffer( content[20:20+8*n*nseries], '<f8' ).reshape( n, nseries ) )
+			content = content[20+8*n*nseries:]
+		return arrays
+
+	return [ np.loadtxt( io.BytesIO( part ), ndmin=2 ) for part in content.split( b'\n\n' ) ]
+
+
+@pytest.mark.parametrize( 'extension', [ '.txt', '.npy', '.npz', '.raw', '.bin' ] )
+@pytest.mark.parametrize( 'dtype', [ np.float64, np.float32 ] )
+def test_write_data( tmp_path, extension, dtype ) :
+	"The data written by write_data are read back unchanged, one array per input."
+
+	rng = np.random.default_rng( 5 )
+	datasets = [ ( 70000, [ np.arange( 70000, dtype=dtype ), rng.standard_normal( 70000 ).astype( dtype ) ] ),
+	             ( 3, [ rng.standard_normal( 3 ).astype( dtype ) for i in range( 4 ) ] ) ]
+	if extension != '.txt' :
+		datasets.insert( 1, ( 0, None ) )
+
+	path = str( tmp_path/( 'data' + extension ) )
+	fractions = []
+	with open( path, 'wb' ) as f :
+		write_data( f, datasets, fractions.append )
+
+	arrays = _read_back( path )
+	assert len( arrays ) == len( datasets )
+	if extension == '.txt' :
+		with open( path, 'rb' ) as f :
+			assert f.read().count( b'\n\n' ) == len( datasets ) - 1
+	for array, ( n, data ) in zip( arrays, datasets ) :
+		if n == 0 :
+			assert array.size == 0
+		else :
+			assert np.array_equal( array.astype( dtype ), np.column_stack( data ) )
+
+	if extension != '.npz' :
+		assert fractions == sorted( fractions ) and fractions[-1] == 1.
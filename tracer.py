@@ -26,788 +26,3186 @@ import os
 import sys
 import stat
 import signal
+import mmap
 import time
+import re
+import struct
 import copy
+import json
+import operator
+import numpy as np
+
+
+class _SlidingExtremum :
+	"""
+	The minimum, or maximum, of the last values of a series.
+
+	It is maintained by a monotonic deque which is updated by blocks of values,
+	so that appending, evicting and reading the extremum take an amortized constant time per value.
+	"""
+
+	def __init__( self, maximum=False, capacity=64 ) :
+
+		self._sign = -1. if maximum else 1.
+		self._positions = np.empty( capacity, np.int64 )
+		self._values = np.empty( capacity )
+		self._head = 0
+		self._tail = 0
+
+
+	def extend( self, values, position ) :
+		"Push a block of values, the first of which has the index 'position' in the series."
+
+		values = self._sign*np.asarray( values, np.float64 )
+		values[np.isnan( values )] = np.inf
+
+		suffix = np.minimum.accumulate( values[::-1] )[::-1]
+		kept = np.empty( len( values ), bool )
+		kept[:-1] = values[:-1] < suffix[1:]
+		kept[-1] = True
+		kept = np.flatnonzero( kept )
+
+		self._tail = self._head + np.searchsorted( self._values[self._head:self._tail], suffix[0], 'left' )
+
+		length = self._tail - self._head
+		if self._tail + len( kept ) > len( self._values ) :
+			capacity = max( len( self._values ), 2*( length + len( kept ) ) )
+			for name in ( '_positions', '_values' ) :
+				old = getattr( self, name )
+				new = np.empty( capacity, old.dtype ) if capacity > len( old ) else old
+				new[:length] = old[self._head:self._tail]
+				setattr( self, name, new )
+			self._head, self._tail = 0, length
+
+		self._positions[self._tail:self._tail+len( kept )] = kept + position
+		self._values[self._tail:self._tail+len( kept )] = values[kept]
+		self._tail += len( kept )
+
+
+	def evict( self, position ) :
+		"Forget the values whose index in the series is lower than 'position'."
+
+		self._head += np.searchsorted( self._positions[self._head:self._tail], position, 'left' )
+
+
+	def value( self ) :
+		"Return the extremum or None if there is no number."
+
+		if self._head == self._tail or self._values[self._head] == np.inf :
+			return None
+		return self._sign*self._values[self._head]
+
+
+class _Pyramid :
+	"""
+	The minima and the maxima of a still series over blocks of BASE values and then over blocks
+	FACTOR times larger at each level, until a level has less than FACTOR*MINIMUM blocks,
+	along with the positions of these extrema in the series.
+
+	The first level is computed in a single pass by chunks of CHUNK values so that no temporary array is as large as the series,
+	the next ones from the previous level. The incomplete last block is left out.
+	The levels can also be given directly as a list of tuples of minima, maxima and their positions.
+	"""
+
+	BASE = 16
+	FACTOR = 4
+	MINIMUM = 1024
+	CHUNK = 1 << 22
+
+	def __init__( self, series=None, levels=None ) :
+
+		if levels is not None :
+			self.levels = levels
+			return
+
+		count = len( series )//self.BASE
+		lowest = np.empty( count, np.int64 )
+		highest = np.empty( count, np.int64 )
+		for start in range( 0, count, self.CHUNK//self.BASE ) :
+			end = min( count, start + self.CHUNK//self.BASE )
+			blocks = series[start*self.BASE:end*self.BASE].reshape( -1, self.BASE )
+			offsets = np.arange( start*self.BASE, end*self.BASE, self.BASE )
+			lowest[start:end] = blocks.argmin( 1 ) + offsets
+			highest[start:end] = blocks.argmax( 1 ) + offsets
+		self.levels = [ ( series[lowest], series[highest], lowest, highest ) ]
+
+		while len( lowest ) >= self.FACTOR*self.MINIMUM :
+			minima, maxima, lowest, highest = self.reduce( self.levels[-1], self.FACTOR )
+			self.levels.append( ( minima, maxima, lowest, highest ) )
+
+
+	@staticmethod
+	def reduce( level, group ) :
+		"Return the extrema and their positions over the groups of 'group' consecutive blocks of a level, the incomplete last group being left out."
+
+		count = len( level[0] )//group
+		minima, maxima, lowest, highest = ( array[:count*group].reshape( -1, group ) for array in level )
+		rows = np.arange( count )
+		low = minima.argmin( 1 )
+		high = maxima.argmax( 1 )
+		return minima[rows,low], maxima[rows,high], lowest[rows,low], highest[rows,high]
+
+
+	def level( self, step ) :
+		"Return the coarsest level whose blocks hold no more than 'step' values and the size of its blocks."
+
+		index, size = 0, self.BASE
+		while index + 1 < len( self.levels ) and size*self.FACTOR <= step :
+			index += 1
+			size *= self.FACTOR
+		return self.levels[index], size
+
+
+class _RingBuffer :
+	"""
+	A contiguous storage for the series with amortized constant time appending and eviction.
+
+	The buffer is kept at least twice as big as the stored data so that
+	each series is always available as a contiguous view without any copy.
+	The stored data are never overwritten: the appends go after them and a new buffer
+	is allocated when there is no more room, so that the views remain valid while the data are appended.
+	A view is thus a snapshot of the data, which only keeps its buffer alive.
+
+	The extrema of each series are tracked as the data are appended and evicted,
+	as well as the last position where the first series does not increase, which tells whether it is sorted.
+	The evicted data are appended to 'archive' if specified.
+	If a 'window' is specified, the data older than this duration before the last ones are evicted too,
+	according to the increasing timestamps of the series 'clock'.
+	"""
+
+	def __init__( self, nseries, band=None, dtype=np.float64, capacity=1024, archive=None, window=None, clock=0 ) :
+
+		self._archive = archive
+		self._window = window
+		self._clock = clock
+
+		if band is not None :
+			capacity = max( capacity, 2*band )
+
+		self._buffer = self._allocate( ( nseries, capacity ), dtype )
+		self._start = 0
+		self._end = 0
+		self._total = 0
+		self._descent = 0
+
+		self._minima = [ _SlidingExtremum() for i in range( nseries ) ]
+		self._maxima = [ _SlidingExtremum( maximum=True ) for i in range( nseries ) ]
+
+
+	def __len__( self ) :
+		return self._end - self._start
+
+
+	def _allocate( self, shape, dtype ) :
+		return np.empty( shape, dtype )
+
+
+	def _make_room( self, n ) :
+
+		length = self._end - self._start
+		capacity = self._buffer.shape[1]
+
+		if 2*( length + n ) > capacity :
+			capacity = max( 2*capacity, 2*( length + n ) )
+
+		buffer = self._allocate( ( self._buffer.shape[0], capacity ), self._buffer.dtype )
+		buffer[:,:length] = self._buffer[:,self._start:self._end]
+		self._buffer = buffer
+		self._start = 0
+		self._end = length
+
+
+	def extend( self, rows, stamp=None ) :
+		"""
+		Append an array with one row of values for each new data.
+
+		If 'stamp' is specified, it is written for each new data into the last series, which the rows do not hold.
+		"""
+
+		n = len( rows )
+		if self._end + n > self._buffer.shape[1] :
+			self._make_room( n )
+
+		if stamp is not None :
+			self._buffer[:-1,self._end:self._end+n] = rows.T
+			self._buffer[-1,self._end:self._end+n] = stamp
+		else :
+			self._buffer[:,self._end:self._end+n] = rows.T
+		self._end += n
+
+		if n > 0 :
+			for i in range( len( self._minima ) ) :
+				self._minima[i].extend( self._buffer[i,self._end-n:self._end], self._total )
+				self._maxima[i].extend( self._buffer[i,self._end-n:self._end], self._total )
+
+			# LA PREMIÈRE VALEUR DU BLOC EST COMPARÉE À LA DERNIÈRE DES PRÉCÉDENTES, S'IL EN RESTE :
+			first = self._end - n - ( self._end - n > self._start )
+			values = self._buffer[0,first:self._end]
+			descents = np.flatnonzero( ~( values[1:] >= values[:-1] ) )
+			if len( descents ) > 0 :
+				self._descent = self._total - ( self._end - n - first ) + descents[-1] + 1
+			self._total += n
+
+
+	def trim( self, band ) :
+		"Evict the oldest data so that no more than 'band' values remain, nor any older than the window."
+
+		start = self._start
+		if band is not None and self._end - start > band :
+			start = self._end - band
+		if self._window is not None and self._end > start :
+			times = self._buffer[self._clock,start:self._end]
+			start += np.searchsorted( times, times[-1] - self._window, 'left' )
+
+		if start > self._start :
+			if self._archive is not None :
+				self._archive.extend( self._buffer[:,self._start:start] )
+			self._start = start
+			for extremum in self._minima + self._maxima :
+				extremum.evict( self._total - ( self._end - start ) )
+
+
+	def limits( self, i ) :
+		"Return the minimum and the maximum of the series i or None if it holds no number."
+
+		if self._minima[i].value() is None :
+			return None
+		return self._minima[i].value(), self._maxima[i].value()
+
+
+	def series( self, i ) :
+		"Return a read-only view on the data of the series i."
+
+		view = self._buffer[i,self._start:self._end]
+		view.flags.writeable = False
+		return view
+
+
+	@property
+	def nbytes( self ) :
+		"The size of the allocated buffer in bytes."
+
+		return self._buffer.nbytes
+
+
+	@property
+	def evicted( self ) :
+		"The number of data evicted since the beginning."
+
+		return self._total - len( self )
+
+
+	@property
+	def sorted( self ) :
+		"Whether the stored values of the first series are in increasing order."
+
+		return self._descent <= self._total - len( self )
+
+
+def _shared_memory( name=None, size=0 ) :
+	"""
+	Create a segment of shared memory, or attach it if 'name' is specified.
+
+	A created segment is not followed by the resource tracker of multiprocessing
+	since it is unlinked by the process which attaches it.
+	The mapping of a segment outlives the object while views on it remain.
+	"""
+
+	from multiprocessing import shared_memory
+
+	class Segment( shared_memory.SharedMemory ) :
+		def __del__( self ) :
+			try :
+				self.close()
+			except BufferError :
+				pass
+
+	try :
+		return Segment( name, name is None, size, track=False )
+	except TypeError :
+		segment = Segment( name, name is None, size )
+		if name is None :
+			from multiprocessing import resource_tracker
+			resource_tracker.unregister( segment._name, 'shared_memory' )
+		return segment
+
+
+class _SharedRingBuffer( _RingBuffer ) :
+	"""
+	A ring buffer allocated in segments of shared memory, written by the worker process.
+
+	Each segment begins with a header made of a sequence number, the start, the end and the total count of the data
+	and the last position where the first series does not increase, followed by the minimum and the maximum of each series.
+	The header is published after each change and the sequence number is odd while it is written.
+	The function 'announce' is called with the name and the capacity of each new segment
+	once the data have been copied into it and its header published, so that it is never seen empty.
+	"""
+
+	HEADER = 5
+
+	def __init__( self, nseries, band=None, dtype=np.float64, announce=None, archive=None, window=None, clock=0 ) :
+
+		self._nseries = nseries
+		self._announce = announce
+		self._segment = None
+
+		_RingBuffer.__init__( self, nseries, band, dtype, archive=archive, window=window, clock=clock )
+
+		self._publish()
+
+
+	def _allocate( self, shape, dtype ) :
+
+		offset = 8*( self.HEADER + 2*self._nseries )
+		self._segment = _shared_memory( size= offset + shape[0]*shape[1]*np.dtype( dtype ).itemsize )
+		self._header = np.frombuffer( self._segment.buf, np.int64, self.HEADER )
+		self._limits = np.frombuffer( self._segment.buf, np.float64, 2*self._nseries, 8*self.HEADER ).reshape( -1, 2 )
+		self._announced = False
+
+		return np.frombuffer( self._segment.buf, dtype, shape[0]*shape[1], offset ).reshape( shape )
+
+
+	def _publish( self ) :
+
+		self._header[0] += 1
+		self._header[1:] = self._start, self._end, self._total, self._descent
+		for i in range( self._nseries ) :
+			limits = self.limits( i )
+			self._limits[i] = limits if limits is not None else ( np.nan, np.nan )
+		self._header[0] += 1
+
+		if not self._announced :
+			self._announced = True
+			self._announce( self._segment.name, self._buffer.shape[1] )
+
+
+	def extend( self, rows, stamp=None ) :
+		_RingBuffer.extend( self, rows, stamp )
+		self._publish()
+
+
+	def trim( self, band ) :
+		_RingBuffer.trim( self, band )
+		self._publish()
+
+
+	def unlink( self ) :
+		"Remove the current segment when the process which was to attach it has gone."
+
+		# L'OUVERTURE PRÉALABLE ÉQUILIBRE LE SUIVI DU SEGMENT PAR MULTIPROCESSING :
+		_shared_memory( self._segment.name ).unlink()
+
+
+class _SharedView :
+	"""
+	The store of a source read by the worker process, mapped from the segments of shared memory it announces.
+
+	The data are read in place: the worker never overwrites them, so that the views remain valid.
+	The segments are unlinked as soon as they are attached and unmapped once no view on them remains.
+	"""
+
+	def __init__( self, nseries, dtype=np.float64 ) :
+
+		self._nseries = nseries
+		self._dtype = dtype
+		self._segment = None
+
+		self._buffer = np.empty( ( nseries, 0 ), dtype )
+		self._start = 0
+		self._end = 0
+		self._total = 0
+		self._descent = 0
+		self._drawn = 0
+		self._extrema = [ None ]*nseries
+
+
+	def __len__( self ) :
+		return self._end - self._start
+
+
+	def attach( self, name, capacity ) :
+		"Map a new segment announced by the worker."
+
+		segment = _shared_memory( name )
+		segment.unlink()
+		self._segment = segment
+
+		offset = 8*( _SharedRingBuffer.HEADER + 2*self._nseries )
+		self._header = np.frombuffer( segment.buf, np.int64, _SharedRingBuffer.HEADER )
+		self._limits = np.frombuffer( segment.buf, np.float64, 2*self._nseries, 8*_SharedRingBuffer.HEADER ).reshape( -1, 2 )
+		self._buffer = np.frombuffer( segment.buf, self._dtype, self._nseries*capacity, offset ).reshape( self._nseries, capacity )
+
+		self.trim()
+
+
+	def trim( self, band=None ) :
+		"Read the header published by the worker, which evicts the data itself."
+
+		if self._segment is None :
+			return
+
+		while True :
+			sequence = self._header[0]
+			if sequence%2 == 0 :
+				start, end, total, descent = self._header[1:].tolist()
+				limits = self._limits.tolist()
+				if self._header[0] == sequence :
+					break
+
+		self._start, self._end, self._total, self._descent = start, end, total, descent
+		self._extrema = [ tuple( pair ) if pair[0] == pair[0] else None for pair in limits ]
+
+
+	def lag( self ) :
+		"Return the number of data published since the previous call."
+
+		self.trim()
+		lag = self._total - self._drawn
+		self._drawn = self._total
+		return lag
+
+
+	def limits( self, i ) :
+		return self._extrema[i] if len( self ) > 0 else None
+
+
+	def series( self, i ) :
+		view = self._buffer[i,self._start:self._end]
+		view.flags.writeable = False
+		return view
+
+
+	@property
+	def nbytes( self ) :
+		return self._buffer.nbytes
+
+	@property
+	def evicted( self ) :
+		return self._total - len( self )
+
+	@property
+	def sorted( self ) :
+		return self._descent <= self._total - len( self )
+
+
+class _Archive :
+	"""
+	An append-only archive on disk of the data evicted from the store of a source.
+
+	The data are written into memory-mapped chunk files of CHUNK values for each series, one series after the other,
+	so that reading a range of the history only maps the chunks it covers.
+	The files are named after 'name' followed by the index of the chunk, along with a JSON file
+	describing them with the series grouped by subplots as 'series' and whether they are followed by the arrival times as 'stamped'.
+	Only the archive created with 'create' writes them.
+
+	The description is replaced atomically whenever a chunk is full and at least every PERIOD seconds,
+	and once more by _finish when the process ends, so that an interrupted recording can still be read back.
+	"""
+
+	CHUNK = 1 << 18
+	PERIOD = 10.
+
+	# ARCHIVES EN COURS D'ENREGISTREMENT DANS CE PROCESSUS :
+	recording = []
+
+	def __init__( self, directory, name, series, dtype=np.float64, create=True, stamped=False ) :
+
+		self._path = os.path.join( directory, name )
+		self._nseries = sum( len( subplot ) for subplot in series ) + stamped
+		self._dtype = np.dtype( dtype )
+		self._writing = None
+		self._reading = {}
+		self.length = 0
+
+		if create :
+			os.makedirs( directory, exist_ok=True )
+			self._description = { 'series': series, 'stamped': stamped, 'dtype': self._dtype.name, 'chunk': self.CHUNK, 'length': 0 }
+			self.close()
+			_Archive.recording.append( self )
+
+
+	def _chunk( self, index, mode ) :
+		return np.memmap( '%s.%06i' % ( self._path, index ), self._dtype, mode, shape=( self._nseries, self.CHUNK ) )
+
+
+	def extend( self, data ) :
+		"Append the columns of the array 'data', which has a row for each series."
+
+		position = 0
+		while position < data.shape[1] :
+			index, offset = divmod( self.length, self.CHUNK )
+			if offset == 0 :
+				self._writing = self._chunk( index, 'w+' )
+			count = min( self.CHUNK - offset, data.shape[1] - position )
+			self._writing[:,offset:offset+count] = data[:,position:position+count]
+			self.length += count
+			position += count
+			if offset + count == self.CHUNK :
+				self.close()
+
+		if time.monotonic() - self._described > self.PERIOD :
+			self.close()
+
+
+	def read( self, start, stop ) :
+		"Return the archived data between the positions 'start' and 'stop' as an array with a row for each series."
+
+		parts = []
+		for index in range( start//self.CHUNK, ( stop - 1 )//self.CHUNK + 1 ) :
+			if index not in self._reading :
+				if len( self._reading ) >= 8 :
+					self._reading.clear()
+				self._reading[index] = self._chunk( index, 'r' )
+			offset = index*self.CHUNK
+			parts.append( self._reading[index][:,max( start - offset, 0 ):min( stop - offset, self.CHUNK )] )
+
+		if not parts :
+			return np.empty( ( self._nseries, 0 ), self._dtype )
+		return np.concatenate( parts, axis=1 )
+
+
+	def close( self ) :
+		"Write the data of the current chunk to the disk and replace the description of the archive with one of its current length."
+
+		if self._writing is not None :
+			self._writing.flush()
+		self._description['length'] = self.length
+		with open( self._path + '.json.tmp', 'w' ) as f :
+			json.dump( self._description, f )
+		os.replace( self._path + '.json.tmp', self._path + '.json' )
+		self._described = time.monotonic()
+
+
+# CHEMINS DES SOCKETS UNIX SUR LESQUELS ÉCOUTE LE PROCESSUS, AVEC LEUR PÉRIPHÉRIQUE ET LEUR INODE :
+_BOUND_PATHS = []
+
+def _finish( signum=None, frame=None ) :
+	"""
+	Write the description of the archives being recorded by the process and remove the Unix sockets it listens on,
+	unless they have been replaced since, at its exit or when it is terminated.
+	As the handler of a signal, the signal is then raised again with its default action.
+	"""
+
+	for archive in _Archive.recording :
+		archive.close()
+
+	while _BOUND_PATHS :
+		path, identity = _BOUND_PATHS.pop()
+		try :
+			status = os.stat( path )
+			if ( status.st_dev, status.st_ino ) == identity :
+				os.unlink( path )
+		except OSError :
+			pass
+
+	if signum is not None :
+		signal.signal( signum, signal.SIG_DFL )
+		os.kill( os.getpid(), signum )
+
+
+class _Source :
+	"""
+	An input of the tracer with its reading state, its series and the lines they are drawn with.
+
+	'subplot' is the index of the first subplot fed by the source.
+	If 'listening' is set, the file is a listening socket of this type.
+	'path' is the path of the file if it is known, next to which the index and the pyramids of a file are cached.
+	For a figure given by --figure, 'selection' holds the positions of its series among those parsed by the reader, if not all of them.
+	"""
+
+	def __init__( self, file, name, fromfile=False, columns=None, offset=None, subplot=0, listening=None, path=None ) :
+
+		self.file = file
+		self.name = name
+		self.path = path
+		self.fd = file.fileno()
+		self.fromfile = fromfile
+		self.columns = columns
+		self.offset = offset
+		self.subplot = subplot
+		self.nsubplots = len( columns ) if columns is not None else 1
+		self.listening = listening
+
+		self.ended = False
+
+		self.series = None
+		self.nseries = 0
+		self.stamped = False
+		self.shedding = 1
+		self.phase = 0
+		self.store = None
+		self.backup = None
+		self.archive = None
+		self.history = None
+
+		self.pyramids = None
+		self.sorted_x = True
+
+		self.selection = None
+
+		self.first = None
+		self.lines = []
+		self.lines_data = []
+		self.decimation_ranges = []
+
+
+class _Connection :
+	"A stream feeding a source, with its last incomplete line or record."
+
+	def __init__( self, fd, source, sock=None ) :
+
+		self.fd = fd
+		self.source = source
+		self.socket = sock
+		self.tail = b''
+
+
+def _pending_bytes( fd ) :
+	"Return the number of bytes waiting to be read on a stream, or 0 if it cannot tell."
+
+	import fcntl
+	import termios
+
+	try :
+		return struct.unpack( 'i', fcntl.ioctl( fd, termios.FIONREAD, b'\0'*4 ) )[0]
+	except OSError :
+		return 0
+
+
+def _write_out( parts ) :
+	"""
+	Write a list of buffers on the standard output with as few system calls as possible and without joining them,
+	after what Python may still hold for it, waiting for it to be writable if it has been made non-blocking.
+	"""
+
+	import select
+
+	sys.stdout.flush()
+	fd = sys.stdout.fileno()
+
+	parts = [ memoryview( part ).cast( 'B' ) for part in parts if len( part ) > 0 ]
+	limit = os.sysconf( 'SC_IOV_MAX' ) if 'SC_IOV_MAX' in os.sysconf_names else 1024
+	while parts :
+		try :
+			written = os.writev( fd, parts[:limit] )
+		except BlockingIOError :
+			select.select( [], [ fd ], [] )
+			continue
+		while parts and written >= len( parts[0] ) :
+			written -= len( parts[0] )
+			del parts[0]
+		if written > 0 :
+			parts[0] = parts[0][written:]
+
+
+_SCREEN_SIZE = None
+
+def _screen_size() :
+	"Return the width and the height of the screen in pixels, which are asked to xrandr only once."
+
+	global _SCREEN_SIZE
+
+	if _SCREEN_SIZE is None :
+		screen_size = os.popen( "xrandr | grep \* | cut -d ' ' -f4" ).readline().split( 'x' )
+		_SCREEN_SIZE = int( screen_size[0] ), int( screen_size[1] )
+
+	return _SCREEN_SIZE
+
+
+class _FrameWriter :
+	"""
+	A background thread encoding into PNG files the frames rendered in headless mode.
+
+	Only the latest frame waits to be written, so that a slow disk makes frames be skipped instead of delaying the rendering.
+	Each file is written next to its destination and then renamed, so that a reader never sees a partial image.
+	If the path contains an integer conversion, the written frames are numbered from 0.
+	"""
+
+	def __init__( self, path ) :
+
+		import threading
+
+		self.path = path
+		self.count = 0
+
+		self._frame = None
+		self._closed = False
+		self._condition = threading.Condition()
+
+		self._thread = threading.Thread( target=self._write )
+		self._thread.daemon = True
+		self._thread.start()
+
+
+	def put( self, frame ) :
+		"Hand over an RGBA array, replacing the frame still waiting if any."
+
+		with self._condition :
+			self._frame = frame
+			self._condition.notify()
+
+
+	def close( self ) :
+		"Write the last frame and stop the thread."
+
+		with self._condition :
+			self._closed = True
+			self._condition.notify()
+		self._thread.join()
+
+
+	def _write( self ) :
+
+		from matplotlib import image
+
+		while True :
+
+			with self._condition :
+				while self._frame is None and not self._closed :
+					self._condition.wait()
+				frame, self._frame = self._frame, None
+
+			if frame is None :
+				return
+
+			path = self.path % self.count if '%' in self.path else self.path
+			try :
+				image.imsave( path + '.tmp', frame, format='png' )
+				os.replace( path + '.tmp', path )
+			except OSError as e :
+				sys.stderr.write( "Unable to write %s: %s\n" % ( path, e.strerror ) )
+				continue
+			self.count += 1
 
 
 class Tracer :
 	"""
 	A class to plot curves in real time or from a text file.
 
-	For a direct use, just do :
-	    Tracer().run()
-	
-	The number in square brackets is the amount of data plotted.
-	"""
+	For a direct use, just do :
+	    Tracer().run()
+	
+	The numbers in square brackets are the amount of data plotted for each input.
+	"""
+
+	# INDEX DES LIGNES DES FICHIERS :
+	INDEX_MAGIC = 0x7472616365720001
+	INDEX_STEP = 4096
+	INDEX_CHUNK = 1 << 26
+
+	# NOMBRE DE DONNÉES D'UN FICHIER À PARTIR DUQUEL SONT CALCULÉES LES PYRAMIDES D'EXTREMUMS :
+	PYRAMID_THRESHOLD = 1 << 20
+	PYRAMID_MAGIC = 0x7472616365720003
+
+	# COMPTEURS DE LA LECTURE :
+	COUNTERS = ( 'bytes', 'lines', 'accepted', 'rejected', 'parse_ns', 'catchups', 'shed' )
+
+	# PART DU TEMPS LAISSÉE À LA LECTURE LORSQU'ELLE EST EN RETARD :
+	READING_SHARE = 0.5
+
+	# FACTEUR MAXIMAL DE RÉDUCTION DES DONNÉES EN CAS DE SURCHARGE :
+	SHEDDING_MAX = 1024
+
+	# PROPORTION D'UN BLOC EN ATTENTE SUR UN FLUX À PARTIR DE LAQUELLE SA LECTURE EST EN RETARD :
+	BACKLOG = 0.5
+
+	# OPTIONS DE LA LECTURE ET DE MATPLOTLIB COMMUNES À TOUTES LES FIGURES DE --figure :
+	SHARED_OPTIONS = ( 'file', 'listen', 'binary', 'sep', 'ncolumns', 'offset', 'float32', 'overload', 'workers',
+	                   'quiet', 'reprint', 'daemon', 'headless', 'out', 'Qt4', 'latex' )
+
+	def _s_positive_int( self, arg ) :
+		try :
+			s_positive_int = int( arg )
+			assert s_positive_int > 0
+		except :
+			raise argparse.ArgumentTypeError( "invalid strictly positive int value: '%s'" % arg )
+		return s_positive_int
+
+
+	def _columns( self, arg ) :
+		try :
+			columns = []
+			for subplot in arg.split( '/' ) :
+				columns.append( [] )
+				for column in subplot.split( ',' ) :
+					column_range = column.split( ':' )
+
+					assert len( column_range ) <= 3
+
+					if len( column_range ) == 3 :
+						step = int( column_range[2] )
+					else :
+						step = 1
+
+					if len( column_range ) >= 2 :
+						start = int( column_range[0] )
+						if column_range[1][0] == 'x' :
+							stop  = start + step*( abs( int( column_range[1][1:] ) ) - 1 )
+							order = 1 if step >= 0 else -1
+						else :
+							stop  = int( column_range[1] )
+							order = 1 if start <= stop else -1
+						columns[-1].extend( range( start, stop + order, order*abs( step ) ) )
+					else :
+						columns[-1].append( int( column_range[0] ) )
+
+		except :
+			raise argparse.ArgumentTypeError( "invalid columns list: '%s': must be integers separeted by commas, slashes or colons to indicate a range" % arg )
+		return columns
+
+
+	def _indexes( self, arg ) :
+		try :
+			indexes = arg.split( ',' )
+			for i, index in enumerate( indexes ) :
+				indexes[i] = int( index )
+				assert indexes[i] > 0
+		except :
+			raise argparse.ArgumentTypeError( "invalid list: '%s': must be integers separeted by commas" % arg )
+		return indexes
+
+
+	def _float_list( self, arg ) :
+		try :
+			floats = arg.split( ',' )
+			for i, value in enumerate( floats ) :
+				if value == '' :
+					floats[i] = self.lines_width
+				else :
+					floats[i] = float( value )
+		except :
+			raise argparse.ArgumentTypeError( "invalid list: '%s': must be floats separeted by commas" % arg )
+		return floats
+
+
+	def _percentage( self, arg ) :
+		try :
+			percentage = float( arg )
+			assert percentage >= 0 and percentage <= 100
+		except :
+			raise argparse.ArgumentTypeError( "invalid percentage value: '%s'" % arg )
+		return percentage
+
+
+	def _size( self, arg ) :
+		try :
+			size = arg.split( 'x' )
+			size[0] = float( size[0] )
+			size[1] = float( size[1] )
+			assert len( size ) == 2 and size[0] > 0 and size[1] > 0 and size[0] <= 100 and size[1] <= 100
+		except :
+			raise argparse.ArgumentTypeError( "invalid size: '%s': must be of the form 'WIDTH(%)xHEIGHT(%)'" % arg )
+		return size
+
+
+	def _str_list( self, arg ) :
+		return arg.split( ',' )
+
+
+	def _record_format( self, arg ) :
+		try :
+			formats = []
+			if arg[0] in '@=<>!' or re.match( r'^(\d*[xcbB?hHiIlLqQnNefd])+$', arg ) :
+				order = '<' if arg[0] == '<' else '>' if arg[0] in '>!' else '='
+				body = arg[1:] if arg[0] in '@=<>!' else arg
+				prefix = arg[0] if arg[0] in '@=<>!' else ''
+				for count, code in re.findall( r'(\d*)(.)', body ) :
+					assert code in 'xcbB?hHiIlLqQnNefd'
+					for i in range( int( count ) if count else 1 ) :
+						offset = struct.calcsize( prefix + ''.join( c for o, c in formats ) + code ) - struct.calcsize( prefix + code )
+						formats.append( ( offset, code ) )
+				itemsize = struct.calcsize( arg )
+				# LES ENTIERS PRENNENT LA TAILLE DONNÉE PAR struct, QUI PEUT DIFFÉRER DE CELLE DE NUMPY POUR LE MÊME CODE :
+				fields = [ ( offset, order + ( '%s%i' % ( 'i' if code.islower() else 'u', struct.calcsize( prefix + code ) ) if code in 'bBhHiIlLqQnN' else code ) )
+				           for offset, code in formats if code not in 'xc' ]
+			else :
+				itemsize = 0
+				fields = []
+				for item in arg.split( ',' ) :
+					kind, bits, count = re.match( r'^([fiu])(8|16|32|64)(?:x(\d+))?$', item ).groups()
+					assert kind != 'f' or bits != '8'
+					for i in range( int( count ) if count else 1 ) :
+						fields.append( ( itemsize, '=%s%i' % ( kind, int( bits )//8 ) ) )
+						itemsize += int( bits )//8
+			assert len( fields ) > 0
+			return np.dtype( { 'names': [ 'f%i' % ( i + 1 ) for i in range( len( fields ) ) ],
+			                   'formats': [ code for offset, code in fields ],
+			                   'offsets': [ offset for offset, code in fields ],
+			                   'itemsize': itemsize } )
+		except :
+			raise argparse.ArgumentTypeError( "invalid record format: '%s': must be a list of TYPEBITS[xCOUNT] separated by commas or a struct format string" % arg )
+
+
+	def _duration( self, arg ) :
+		try :
+			value, unit = re.fullmatch( r'([0-9.]+(?:e-?[0-9]+)?)(ms|s|min|m|h)?', arg ).groups()
+			duration = float( value )*{ 'ms': 1e-3, 's': 1, 'min': 60, 'm': 60, 'h': 3600, None: 1 }[unit]
+			assert duration > 0
+		except :
+			raise argparse.ArgumentTypeError( "invalid duration: '%s': must be a positive number of seconds optionally followed by 'ms', 's', 'm' or 'h'" % arg )
+		return duration
+
+
+	def _output( self, arg ) :
+		try :
+			if '%' in arg :
+				arg % 0
+		except :
+			raise argparse.ArgumentTypeError( "invalid output path: '%s': may only contain an integer conversion like '%%06d'" % arg )
+		return arg
+
+
+	def _address( self, arg ) :
+		import socket
+		try :
+			scheme, address = arg.split( '://', 1 )
+			if scheme == 'unix' :
+				assert address
+				return arg, socket.AF_UNIX, socket.SOCK_STREAM, address
+			kind = { 'tcp': socket.SOCK_STREAM, 'udp': socket.SOCK_DGRAM }[scheme]
+			host, port = address.rsplit( ':', 1 )
+			family, kind, proto, name, address = socket.getaddrinfo( host.strip( '[]' ) or None, int( port ), 0, kind, 0, socket.AI_PASSIVE )[0]
+			return arg, family, kind, address
+		except socket.gaierror as e :
+			raise argparse.ArgumentTypeError( "invalid address: '%s': %s" % ( arg, e.strerror ) )
+		except :
+			raise argparse.ArgumentTypeError( "invalid address: '%s': must be of the form 'tcp://HOST:PORT', 'udp://HOST:PORT' or 'unix://PATH'" % arg )
+
+
+	def _input( self, arg ) :
+		if arg == '-' :
+			return sys.stdin
+		try :
+			if stat.S_ISSOCK( os.stat( arg ).st_mode ) :
+				import socket
+				sock = socket.socket( socket.AF_UNIX, socket.SOCK_STREAM )
+				try :
+					sock.connect( arg )
+				except :
+					sock.close()
+					raise
+				f = open( sock.detach(), 'rb', buffering=0 )
+				f.name = arg
+				return f
+			return open( arg, 'rb', buffering=0 )
+		except OSError as e :
+			raise argparse.ArgumentTypeError( "can't open '%s': %s" % ( arg, e.strerror ) )
+
+	
+	def __init__( self, args=None, input=None,
+	              
+				  # PÉRIODE DE RAFRAÎCHISSEMENT PAR DÉFAUT :
+				  rate = 0.05,
+
+	              # TAILLE DES BLOCS LUS SUR L'ENTRÉE :
+	              chunk_size = 65536,
+
+	              # PÉRIODE DES STATISTIQUES :
+	              stats_period = 1.,
+
+                  # TAILLE DE LA FENÊTRE PAR DÉFAUT :
+                  w = 650,
+                  h = 524,
+
+                  # COULEURS DE LA FIGURE :
+                  face_color = '0.25',
+                  background_color = '0.5',
+                  grid_color = 'w',
+                  axis_color = '0.9',
+                  ticks_color = '0.9',
+                  labels_color = '0.9',
+                  title_color = '0.7',
+                  legends_color = '0.9',
+                  edge_color = 'k',
+
+                  # ÉPAISSEUR DES COURBES PAR DÉFAUT :
+                  lines_width = 1.0,
+
+                  # COULEURS DES COURBES PAR DÉFAUT :
+				  lines_color = [ 'b', 'g', 'r', 'm', 'y', 'c' ],
+
+                  # TRACEUR QUI LIT LES ENTRÉES POUR CETTE FIGURE :
+                  reader = None ) :
+
+		"""
+		At the declaration, parse the argument from the command line
+		or from the string 'args' if specified.
+
+		You can directly specify a file object or a list of file objects to use as inputs.
+
+		'rate' is the default minimum time in seconds between two updates,
+		'chunk_size' is the maximum number of bytes read at once from a stream,
+		'stats_period' is the time in seconds between two samples of the performance counters,
+		'w' and 'h' are the default size of the window in pixels,
+		'lines_width' is the default width of the lines,
+		'lines_color' is a list of their default colors
+		and the other arguments are the figure's colors.
+
+		If 'reader' is specified, this tracer is one of the figures given by --figure to the tracer 'reader',
+		which reads the inputs for it: 'args' then only holds the options of this figure,
+		the other ones being those of the reader.
+		"""
+
+		self.progname = os.path.basename( sys.argv[0] )
+
+		self.w = w
+		self.h = h
+
+		self.x = None
+		self.y = None
+
+		self.lines_width = lines_width
+		self.lines_color = lines_color
+
+		self.chunk_size = chunk_size
+		self.stats_period = stats_period
+
+		self.parser = argparse.ArgumentParser()
+		self.parser.add_argument( '--sep', type=str, help="set the delimiter string" )
+		self.parser.add_argument( '-C', '--columns', type=self._columns, action='append', help="specify the columns to be processed, separated by commas (a colon indicates a range and an extra colon specifies a step) while subplots are separated by slashes, given once for all the inputs or once for each of them" )
+		self.parser.add_argument( '-n', '--ncolumns', type=self._s_positive_int, help="process only the lines with N columns" )
+		self.parser.add_argument( '-a', '--abscissa', action='store_true', help="take the first series as abscissa" )
+		self.parser.add_argument( '-f', '--file', type=self._input, action='append', help="read from the file, the pipe or the Unix socket FILE, or from the standard input if FILE is '-', which can be repeated to read from several inputs at once" )
+		self.parser.add_argument( '--listen', type=self._address, action='append', metavar='URL', help="listen on 'tcp://HOST:PORT', 'udp://HOST:PORT' or 'unix://PATH' for any number of producers feeding the same series, which can be repeated" )
+		self.parser.add_argument( '--binary', type=self._record_format, metavar='FORMAT', help="read fixed-size binary records described by types separated by commas like 'f64x12' or 'i32,f32x4' or by a struct format string like '<12d'" )
+		self.parser.add_argument( '-o', '--offset', type=self._s_positive_int, help="add a starting offset" )
+		self.parser.add_argument( '-b', '--band', type=self._s_positive_int, help="limit the number of data to display" )
+		self.parser.add_argument( '--window', type=self._duration, metavar='DURATION', help="only display the data of the last DURATION, like '30s' or '5m', according to the first series taken as increasing timestamps with -a or to the arrival times otherwise" )
+		self.parser.add_argument( '--archive', type=str, metavar='DIR', help="keep the data evicted from the band in chunk files in DIR, through which the view can be scrolled back while paused" )
+		self.parser.add_argument( '--float32', action='store_true', help="store the data in single precision" )
+		self.parser.add_argument( '-r', '--rate', type=float, default=rate, help="set a minimum time in seconds between two updates of the window" )
+		self.parser.add_argument( '--overload', choices=[ 'block', 'drop-oldest', 'decimate', 'aggregate' ], default='block', help="choose what to do when the streams come faster than they are read: let the producers wait, skip to the newest data, keep one line out of N or replace each bucket of N lines by their minimums, means and maximums, N being adapted to the backlog (the lines skipped or left out are not parsed, so that those which would be rejected are not written either, unless -p writes them all)" )
+		self.parser.add_argument( '--maxperiod', type=float, default=1., help="set a maximum time in seconds between two updates of the window, up to which they are spaced out while the reading is behind" )
+		self.parser.add_argument( '--workers', action='store_true', help="read the streams in a separate process which shares the data with the window" )
+		self.parser.add_argument( '--blit', action='store_true', help="only redraw the curves and the counter between two changes of the axes limits" )
+		self.parser.add_argument( '--nodecimation', action='store_true', help="plot every point instead of the minimum and maximum of each pixel column" )
+		self.parser.add_argument( '-q', '--quiet', action='store_true', help="silence unprocessed lines" )
+		self.parser.add_argument( '-p', '--pass', dest='reprint', action='store_true', help="rewrite the data on standard output" )
+		self.parser.add_argument( '--stats', type=str, metavar='FILE', help="write the performance counters as JSON lines into FILE, or into the file descriptor FILE if it is a number" )
+		self.parser.add_argument( '--daemon', action='store_true', help="keep the interpreter and Matplotlib loaded and serve the next calls of the program, each in a new window, which takes no other option" )
+		self.parser.add_argument( '--headless', action='store_true', help="render the figure with Agg into the file given by --out instead of showing a window" )
+		self.parser.add_argument( '--out', type=self._output, metavar='PATH', help="write the frames as PNG images into PATH at the refresh rate, overwritten atomically unless it contains an integer conversion like '%%06d' to number them, which implies --headless" )
+		self.parser.add_argument( '--figure', type=str, action='append', metavar='OPTIONS', help="open a window whose OPTIONS, like '-aC1,2 -x25', complete or replace the ones given outside, which can be repeated to spread the same inputs over several windows while parsing them only once" )
+		self.parser.add_argument( '-x', '--x_pos', type=self._percentage, help="position the window in a percentage relative to the width of the screen" )
+		self.parser.add_argument( '-y', '--y_pos', type=self._percentage, help="position the window in a percentage relative to the height of the screen" )
+		self.parser.add_argument( '-s', '--size', type=self._size, help="resize the window in percentages relative to the screen according to the format 'WIDTHxHEIGHT'" )
+		self.parser.add_argument( '-c', '--colors', type=self._str_list, default=self.lines_color, help="set the color cycle for the lines, separated by commas" )
+		self.parser.add_argument( '-l', '--loop', action='store_true', help="loop the colors at each subplots" )
+		self.parser.add_argument( '-d', '--dashed', type=self._indexes, help="declare dashed lines, separated by commas" )
+		self.parser.add_argument( '-t', '--dotted', type=self._indexes, help="declare dotted lines, separated by commas" )
+		self.parser.add_argument( '-m', '--mixed', type=self._indexes, help="declare mixed lines, separated by commas" )
+		self.parser.add_argument( '-w', '--linewidth', type=self._float_list, help="set the linewidths, separated by commas" )
+		self.parser.add_argument( '-z', '--zero', type=self._indexes, nargs='?', const=[0], help="declare subplots where to keep zero in sight, separated by commas or every one when not specified" )
+		self.parser.add_argument( '-g', '--nogrid', type=self._indexes, nargs='?', const=[0], help="declare subplots where not to display the grid, separated by commas or every one when not specified" )
+		self.parser.add_argument( '-L', '--labels', type=self._str_list, default=[], help="set the labels for each series, separated by commas" )
+		self.parser.add_argument( '-A', '--xlabel', type=str, help="set the label for the abscissa" )
+		self.parser.add_argument( '-T', '--titles', type=self._str_list, help="set the titles for each subplots, separated by commas" )
+		self.parser.add_argument( '-X', '--latex', action='store_true', help="use LaTeX for the texts" )
+		self.parser.add_argument( '-P', '--plain', action='store_true', help="set plain colors for the figure" )
+		self.parser.add_argument( '-S', '--transparent', action='store_true', help="set the margins transparent" )
+		self.parser.add_argument( '-Q', '--Qt4', action='store_true', help="use Qt4 as backend" )
+		self.parser.add_argument( '--ylog', type=self._indexes, nargs='?', const=[0], help="declare y axes where to use a log scale, separated by commas or every one when not specified" )
+		self.parser.add_argument( '--xlog', action='store_true', help="use a log scale for the x axis, which implies to take the first series as abscissa" )
+
+
+		# LECTURE DES ARGUMENTS :
+
+		self._reader = reader
+		self._figures = []
+
+		# LES ARCHIVES DES FIGURES DE --figure SONT DISTINGUÉES PAR LEUR NUMÉRO :
+		self._archive_prefix = 'figure%i-' % ( len( reader._figures ) + 1 ) if reader is not None else ''
+
+		if reader is not None :
+			namespace = copy.copy( reader.args )
+			namespace.columns = None
+			namespace.figure = None
+			self.args = self.parser.parse_args( args.split(), namespace=namespace )
+			if self.args.figure is not None :
+				self.parser.error( "the option --figure cannot be given in --figure" )
+			if any( getattr( self.args, option ) != getattr( reader.args, option ) for option in self.SHARED_OPTIONS ) :
+				self.parser.error( "the options of the inputs and of the backend apply to all the figures and cannot be given in --figure" )
+			if self.args.columns is None :
+				self.args.columns = reader.args.columns
+		else :
+			argv = args.split() if args is not None else sys.argv[1:]
+			# LES OPTIONS D'UNE FIGURE COMMENÇANT PAR UN TIRET, ELLES SONT ACCOLÉES À --figure :
+			for i in range( len( argv ) - 1, 0, -1 ) :
+				if argv[i-1] == '--figure' :
+					argv[i-1:i+1] = [ '--figure=' + argv[i] ]
+			self.args = self.parser.parse_args( argv )
+
+		if self.args.daemon :
+			self.parser.error( "the option --daemon takes no other option" )
+
+		if self.args.xlog :
+			self.args.abscissa = True
+
+		if self.args.out is not None :
+			self.args.headless = True
+		elif self.args.headless :
+			self.parser.error( "the option --headless requires --out" )
+
+		if self.args.archive is not None and os.path.isdir( self.args.archive ) and os.listdir( self.args.archive ) :
+			self.parser.error( "the archive directory '%s' is not empty" % self.args.archive )
+
+		if self.args.overload in ( 'drop-oldest', 'decimate' ) and self.args.reprint and self.args.quiet and self.args.binary is None :
+			self.parser.error( "the lines written by -p with -q are selected by parsing them, which --overload %s skips" % self.args.overload )
+
+		if self.args.figure is not None :
+			if self.args.workers :
+				self.parser.error( "the option --workers does not apply to several figures" )
+			if self.args.headless :
+				self.parser.error( "the option --out does not apply to several figures" )
+			if self.args.stats is not None :
+				self.parser.error( "the option --stats has to be given in --figure for each figure" )
+
+
+		# INITIALISATIONS :
+
+		self._dtype = np.float32 if self.args.float32 else np.float64
+
+		if self.args.sep is not None :
+			self._sep = self.args.sep.encode( 'utf-8' )
+
+		if reader is not None :
+			files = [ source.file for source in reader._sources ]
+			fromfile = [ source.fromfile for source in reader._sources ]
+		else :
+			if input is not None :
+				files = input if isinstance( input, ( list, tuple ) ) else [ input ]
+			elif self.args.file is not None :
+				files = self.args.file
+			elif self.args.listen is not None :
+				files = []
+			else :
+				files = [ sys.stdin ]
+			# UN FICHIER ORDINAIRE EST LU COMME TEL, MÊME S'IL EST REDIRIGÉ SUR L'ENTRÉE STANDARD :
+			fromfile = [ stat.S_ISREG( os.fstat( f.fileno() ).st_mode ) for f in files ]
+
+		names = [ None ]*len( files )
+		listening = [ None ]*len( files )
+		if reader is not None :
+			names = [ source.name for source in reader._sources ]
+			listening = [ source.listening for source in reader._sources ]
+		elif self.args.listen is not None :
+			for url, family, kind, address in self.args.listen :
+				files.append( self._listen( url, family, kind, address ) )
+				fromfile.append( False )
+				names.append( url )
+				listening.append( kind )
+
+		if self.args.columns is not None and len( self.args.columns ) not in ( 1, len( files ) ) :
+			self.parser.error( "the option -C must be given once or once for every input" )
+
+		self._sources = []
+		subplot = 0
+		for i, f in enumerate( files ) :
+			path = None
+			if names[i] is not None :
+				name = names[i]
+			elif f is sys.stdin :
+				name = 'stdin'
+			elif isinstance( getattr( f, 'name', None ), str ) :
+				name = path = f.name
+			else :
+				name = str( f.fileno() )
+			columns = self.args.columns[i if len( self.args.columns ) > 1 else 0] if self.args.columns is not None else None
+			source = _Source( f, name, fromfile[i], columns, self.args.offset, subplot, listening[i], path )
+			subplot += source.nsubplots
+			self._sources.append( source )
+
+		self.input = files[0] if listening[0] is None else None
+		self.window_title = '%s (%s)' % ( self.progname, ', '.join( source.name for source in self._sources ) )
+
+		self._fromfile = all( fromfile )
+
+		self._workers = self.args.workers and not self._fromfile
+		self._worker = None
+		self._control = None
+
+		import fcntl
+		for source in self._sources :
+			if not source.fromfile :
+				fl = fcntl.fcntl( source.fd, fcntl.F_GETFL )
+				fcntl.fcntl( source.fd, fcntl.F_SETFL, fl | os.O_NONBLOCK )
+
+		if reader is None :
+			sys.stdout = os.fdopen( sys.stdout.fileno(), 'w' )
+
+		if self.args.figure is None :
+			for source in self._sources :
+				if source.columns is not None :
+					self._set_series( source, source.columns )
+
+		self._nsubplots = subplot
+		self._nplotted = 0
+
+		self._abscissa_range = np.arange( 0 )
+
+		# ORIGINE DES INSTANTS D'ARRIVÉE DES DONNÉES :
+		self._origin = time.monotonic()
+
+		self._data_count = 0
+		self._perf = 1.
+
+		if self.args.plain :
+			self.face_color = 'w'
+			self.background_color = 'w'
+			self.grid_color = 'k'
+			self.axis_color = 'k'
+			self.ticks_color = 'k'
+			self.labels_color = 'k'
+			self.title_color = 'k'
+			self.legends_color = 'k'
+			self.edge_color = 'k'
+		else :
+			self.face_color = face_color
+			self.background_color = background_color
+			self.grid_color = grid_color
+			self.axis_color = axis_color
+			self.ticks_color = ticks_color
+			self.labels_color = labels_color
+			self.title_color = title_color
+			self.legends_color = legends_color
+			self.edge_color = edge_color
+
+		self._paused = False
+		self._history_offset = 0
+
+		self._ended = False
+
+		self._blit = self.args.blit and not self._fromfile and not self.args.headless
+		self._backgrounds = None
+
+		self._writer = None
+
+		self._counters = np.zeros( len( self.COUNTERS ), np.int64 ) if reader is None else reader._counters
+		self._frames = 0
+		self._overruns = 0
+		self._redraw_ns = 0
+		# TEMPS D'ATTENTE DU VERROU, COMPTÉ À PART PAR CHAQUE FIL D'EXÉCUTION :
+		self._lock_waits_ns = {}
+		self._overlay = None
+
+		self._period = self.args.rate
+		self._frame_cost = 0.
+		self._byte_cost = 0.
+		self._lag = 0.
+		self._schedule_totals = None
+
+		self._stats_file = None
+		if self.args.stats is not None :
+			try :
+				if self.args.stats.isdigit() :
+					self._stats_file = os.fdopen( int( self.args.stats ), 'w', buffering=1 )
+				else :
+					self._stats_file = open( self.args.stats, 'w', buffering=1 )
+			except OSError as e :
+				self.parser.error( "unable to open '%s': %s" % ( self.args.stats, e.strerror ) )
+
+
+		# VÉRIFICATION DE LA COHÉRENCE DES ARGUMENTS :
+
+		for source in self._sources :
+
+			if self.args.abscissa :
+				n = 2
+				if source.columns is not None :
+					n = len( source.columns[0] )
+				elif self.args.ncolumns is not None :
+					n = self.args.ncolumns
+				if n < 2 :
+					self.parser.error( "there must be at least two series to process if one is put in the abscissa" )
+
+			if source.columns is not None :
+				if self.args.ncolumns is not None and self.args.ncolumns < source.seriesmax :
+					self.parser.error( "the number of columns must be at least equal to the highest selected column" )
+
+			if self.args.binary is not None :
+				if source.columns is not None and len( self.args.binary.names ) < source.seriesmax :
+					self.parser.error( "the records have only %i fields" % len( self.args.binary.names ) )
+
+		if self.args.binary is not None :
+			if self.args.sep is not None or self.args.ncolumns is not None :
+				self.parser.error( "the options --sep and --ncolumns do not apply to binary records" )
+			if self.args.abscissa and any( source.columns is None for source in self._sources ) and len( self.args.binary.names ) < 2 :
+				self.parser.error( "there must be at least two series to process if one is put in the abscissa" )
+
+
+		# FIGURES ALIMENTÉES PAR LA LECTURE :
+
+		if self.args.figure is not None :
+
+			for spec in self.args.figure :
+				self._figures.append( Tracer( spec, rate=rate, chunk_size=chunk_size, stats_period=stats_period, w=w, h=h,
+				                              face_color=face_color, background_color=background_color, grid_color=grid_color,
+				                              axis_color=axis_color, ticks_color=ticks_color, labels_color=labels_color,
+				                              title_color=title_color, legends_color=legends_color, edge_color=edge_color,
+				                              lines_width=lines_width, lines_color=lines_color, reader=self ) )
+
+			# LES SÉRIES SONT DÉTECTÉES POUR TOUTES LES FIGURES OU LEUR RÉUNION EST LUE UNE SEULE FOIS :
+			self.args.abscissa = any( figure.args.abscissa for figure in self._figures )
+			for k, source in enumerate( self._sources ) :
+				columns = [ figure._sources[k].columns for figure in self._figures ]
+				if all( subplots is None for subplots in columns ) :
+					source.columns = None
+				elif any( subplots is None for subplots in columns ) :
+					self.parser.error( "the option -C must be given for every figure or for none of them" )
+				else :
+					source.columns = [ sorted( set( serie for subplots in columns for subplot in subplots for serie in subplot ) ) ]
+					self._set_series( source, source.columns )
+
+			# LA LECTURE D'UN FICHIER S'ARRÊTE LORSQUE LA BANDE DE CHAQUE FIGURE EST PLEINE :
+			bands = [ figure.args.band for figure in self._figures ]
+			self.args.band = None if None in bands else max( bands )
+
+
+	def _listen( self, url, family, kind, address ) :
+		"Return a non-blocking socket bound to the address, which listens for connections if it is a stream."
+
+		import socket
+
+		# UN SOCKET UNIX N'EST REMPLACÉ QUE SI PLUS PERSONNE N'Y ÉCOUTE :
+		if family == socket.AF_UNIX :
+			probe = socket.socket( family, kind )
+			try :
+				if stat.S_ISSOCK( os.stat( address ).st_mode ) :
+					probe.connect( address )
+			except ConnectionRefusedError :
+				try :
+					os.unlink( address )
+				except OSError :
+					pass
+			except OSError :
+				pass
+			finally :
+				probe.close()
+
+		sock = socket.socket( family, kind )
+		try :
+			if family != socket.AF_UNIX :
+				sock.setsockopt( socket.SOL_SOCKET, socket.SO_REUSEADDR, 1 )
+			sock.bind( address )
+			if kind == socket.SOCK_STREAM :
+				sock.listen( socket.SOMAXCONN )
+		except OSError as e :
+			sock.close()
+			self.parser.error( "unable to listen on '%s': %s" % ( url, e.strerror ) )
+
+		if family == socket.AF_UNIX :
+			status = os.stat( address )
+			_BOUND_PATHS.append( ( address, ( status.st_dev, status.st_ino ) ) )
+
+		sock.setblocking( False )
+		return sock
+
+
+	def run( self, show=True, fork=True ) :
+		"""
+		Create the figure and run the reading thread, which watches all the inputs at once.
+
+		If show=True, the standard window is created and the method blocks.
+
+		If fork=True, the program will fork and the parent process is used for terminal handling.
+
+		With --figure, a figure is created for each of the tracers returned by get_figures() instead,
+		which are all fed by the reading of this one.
+		"""
+
+
+		# CRÉATION D'UN SOUS-PROCESSUS :
+
+		if fork :
+
+			child_pid = os.fork()
+
+			if child_pid != 0 :
+
+				def ctrl_c_handler( signum, frame ) :
+					sys.stderr.write( '\r' )
+					try :
+						os.kill( child_pid, signal.SIGTERM )
+						signal.pause()
+					except OSError as e :
+						if e.errno == 3 :
+							pass
+						else :
+							raise
+
+				def exited_child_handler( signum, frame ) :
+					os.waitpid( child_pid, os.WNOHANG )
+
+				signal.signal( signal.SIGCHLD, exited_child_handler )
+				signal.signal( signal.SIGINT, ctrl_c_handler )
+
+				signal.pause()
+
+				sys.exit( 0 )
+
+
+			signal.signal( signal.SIGINT, signal.SIG_IGN )
+			signal.signal( signal.SIGTSTP, signal.SIG_IGN )
+
+
+		# CRÉATION DU PROCESSUS DE LECTURE :
+
+		import threading
+
+		if self._reader is None and ( _BOUND_PATHS or any( tracer.args.archive is not None for tracer in [ self ] + self._figures ) ) :
+			import atexit
+			atexit.register( _finish )
+			signal.signal( signal.SIGTERM, _finish )
+
+		self._data_mutex = threading.Lock() if self._reader is None else self._reader._data_mutex
+		self._generation = 0
+		self._drawn_generation = 0
+		self._caught_up = True
+
+		if self._workers :
+			self._start_worker()
+
+
+		# CRÉATION DES FIGURES DE --figure :
+
+		if self._figures :
+
+			for figure in self._figures :
+				figure.run( show=show, fork=False )
+
+			if self._fromfile :
+				self._read_data()
+				for figure in self._figures :
+					figure._plot_sources()
+					figure._sample_stats( force=True )
+			else :
+				reading_thread = threading.Thread( target=self._read_data )
+				reading_thread.daemon = True
+				reading_thread.start()
+
+			if show :
+				import matplotlib.pyplot as pyplot
+				pyplot.show()
+
+			return 0
+
+
+		# CRÉATION DE LA FENÊTRE :
+
+		import matplotlib
+		if self.args.Qt4 and not self.args.headless :
+			matplotlib.use( 'Qt4Agg' )
+
+		if self.args.latex :
+			matplotlib.rcParams['text.usetex']=True
+
+		if self.args.headless :
+			from matplotlib.figure import Figure
+			from matplotlib.backends.backend_agg import FigureCanvasAgg
+			self.backend = 'agg'
+			self.fig = Figure( figsize=( self.w/100, self.h/100 ), dpi=100 )
+			FigureCanvasAgg( self.fig )
+			self.axes = self.fig.subplots( self._nsubplots, sharex=True )
+		else :
+			import matplotlib.pyplot as pyplot
+			self.backend = matplotlib.get_backend()
+			self.fig, self.axes = pyplot.subplots( self._nsubplots, sharex=True )
+
+		if self._nsubplots == 1 :
+			self.axes = [ self.axes ]
+
+		self.fig.set_facecolor( self.face_color )
+		self.fig.set_edgecolor( self.edge_color )
+
+		if self.args.transparent :
+			self.fig.patch.set_alpha( 0 )
+
+		if self.args.titles is None :
+			self.axes[0].set_title( '[ 0 ]' )
+
+		for i in range( self._nsubplots ) :
+
+			if self.args.titles is not None and len( self.args.titles ) > i :
+				self.axes[i].set_title( self.args.titles[i] )
+			self.axes[i].title.set_color( self.title_color )
+
+			self.axes[i].set_facecolor( self.background_color )
+
+			for spine in self.axes[i].spines.values() :
+				spine.set_color( self.axis_color )
+
+			self.axes[i].tick_params( axis='x', colors=self.ticks_color, which='both' )
+			self.axes[i].xaxis.get_offset_text().set_color( self.ticks_color )
+			self.axes[i].tick_params( axis='y', colors=self.ticks_color, which='both' )
+			self.axes[i].yaxis.get_offset_text().set_color( self.ticks_color )
+
+			if self.args.xlog :
+				self.axes[i].set_xscale( "symlog" )
+			if self.args.ylog is not None and ( self.args.ylog[0] == 0 or i + 1 in self.args.ylog ) :
+				self.axes[i].set_yscale( "symlog" )
+
+			isgrid = False if self.args.nogrid is not None and ( self.args.nogrid[0] == 0 or i + 1 in self.args.nogrid ) else True
+			self.axes[i].grid( color=self.grid_color, ls='dotted', alpha=0.3 )
+			self.axes[i].grid( isgrid )
+			self.axes[i].abscissa = self.axes[i].axhline( color=self.grid_color, ls='dashed', alpha=0.2, visible=isgrid )
+
+			self.axes[i].set_prop_cycle( color=self.args.colors )
+
+			self.axes[i].callbacks.connect( 'xlim_changed', self._on_xlim_changed )
+
+		self._overlay = self.fig.text( 0.01, 0.99, '', ha='left', va='top', family='monospace', fontsize='x-small',
+		                               color=self.labels_color, visible=False, animated=self._blit,
+		                               bbox=dict( facecolor=self.face_color, edgecolor='none', alpha=0.8 ) )
+		self._stats_time = time.monotonic()
+		self._stats_totals = {}
+
+		if self._blit :
+			self.axes[0].title.set_animated( True )
+		self.fig.canvas.mpl_connect( 'draw_event', self._on_draw )
+		if self.args.archive is not None :
+			self.fig.canvas.mpl_connect( 'scroll_event', self._on_scroll )
+
+
+		# AFFICHAGE DES DONNÉES :
+
+		self._timer = None
+		self._new_data = False
+
+		self._plot_sources()
+
+		if self._fromfile and self._reader is None :
+			self._read_data()
+			self._plot_sources()
+			self._sample_stats( force=True )
+		elif not self._workers and self._reader is None :
+			reading_thread = threading.Thread( target=self._read_data )
+			reading_thread.daemon = True
+			reading_thread.start()
+
+		if self.args.headless :
+			self._render()
+		elif show :
+			self.set_window( pyplot.get_current_fig_manager() )
+			if self._reader is None :
+				pyplot.show()
+		else :
+			self.set_window()
+
+		return 0
+
+
+	def _start_worker( self ) :
+		"""
+		Fork the worker process, which reads and parses the streams and writes the data into shared memory,
+		so that this process only maps them to draw them.
+
+		The worker announces its series and its segments through a pipe and publishes the generation counter in a shared page.
+		It exits at the end of the inputs or when the pipe is closed.
+		"""
+
+		import multiprocessing
+
+		self._control, control = multiprocessing.Pipe()
+		self._shared = np.frombuffer( mmap.mmap( -1, mmap.PAGESIZE ), np.int64 )
+		self._counters = self._shared[1:1+len( self.COUNTERS )]
+		self._band = self.args.band
+
+		self._worker = os.fork()
+
+		if self._worker == 0 :
+			self._control.close()
+			self._control = control
+		else :
+			control.close()
+
+		for source in self._sources :
+			if source.series is not None :
+				source.store = self._new_store( source )
+
+		if self._worker == 0 :
+			signal.signal( signal.SIGINT, signal.SIG_IGN )
+			try :
+				self._read_data()
+				sys.stdout.flush()
+			except :
+				import traceback
+				traceback.print_exc()
+				_finish()
+				os._exit( 1 )
+			os._exit( 0 )
+
+
+	def _stop_worker( self ) :
+		"Terminate the worker once the GUI process has gone, removing the segments it has not attached."
+
+		for source in self._sources :
+			if source.store is not None :
+				try :
+					source.store.unlink()
+				except FileNotFoundError :
+					pass
+		_finish()
+		os._exit( 0 )
+
+
+	def _render( self ) :
+		"""
+		Render the figure with Agg at the refresh rate until the end of the inputs, without any display.
+
+		Each frame is handed over to a background thread which encodes it,
+		so that a slow disk only makes frames be skipped.
+		"""
+
+		self._writer = _FrameWriter( self.args.out )
+
+		try :
+			self.fig.canvas.draw()
+
+			deadline = time.monotonic()
+			while not self._fromfile and not ( self._ended and self._drawn_generation == self._generation ) :
+				deadline += self._period
+				delay = deadline - time.monotonic()
+				if delay > 0 :
+					time.sleep( delay )
+				else :
+					deadline = time.monotonic()
+				self._on_timer()
+		finally :
+			self._writer.close()
+
+
+	def set_window( self, fig_manager=None ) :
+		"""
+		Calculate w, h, x and y according to the screen size.
+
+		If a figure manager is given, it will try to set these parameters.
+		"""
+
+		if fig_manager is not None :
+			try :
+				fig_manager.set_window_title( self.window_title )
+			except :
+				sys.stderr.write( self.progname + ": error: unable to rename the window\n" )
+
+		if self.args.x_pos is not None or self.args.y_pos is not None or self.args.size is not None :
+
+			if self.args.x_pos is None :
+				self.args.x_pos = 50
+
+			if self.args.y_pos is None :
+				self.args.y_pos = 50
+
+			try :
+				w_screen, h_screen = _screen_size()
+			except :
+				sys.stderr.write( self.progname + ": error: unable to get the screen size - window setting aborted\n" )
+				return
+
+			if self.args.size is not None :
+				self.w = self.args.size[0]*w_screen/100
+				self.h = self.args.size[1]*h_screen/100
+
+			self.x = int( max( 0, w_screen*self.args.x_pos/100 - self.w/2 ) )
+			self.y = int( max( 0, h_screen*self.args.y_pos/100 - self.h/2 ) )
+
+			if fig_manager is not None :
+				try :
+					if self.backend == 'TkAgg' :
+						fig_manager.window.geometry( '%+i%+i' % ( self.x, self.y ) )
+					else :
+						fig_manager.window.move( self.x, self.y )
+				except :
+					sys.stderr.write( self.progname + ": error: unable to move the window\n" )
+
+		if fig_manager is not None :
+			try :
+				if self.backend == 'TkAgg' :
+					fig_manager.window.geometry( '%ix%i' % ( self.w, self.h ) )
+				else :
+					fig_manager.window.resize( self.w, self.h )
+			except :
+				sys.stderr.write( self.progname + ": error: unable to resize the window\n" )
+
+
+	def _linestyle( self, i ) :
+		if self.args.dashed is not None and i in self.args.dashed :
+			return '--'
+		elif self.args.dotted is not None and i in self.args.dotted :
+			return ':'
+		elif self.args.mixed is not None and i in self.args.mixed :
+			return '-.'
+		else :
+			return '-'
+
+
+	def _legend( self, source, i, series, n_end ) :
+
+		n_start = n_end - len( series )
+		first = source.first + n_start
+		n_labels = max( 0, len( self.args.labels ) - first )
+		labels = self.args.labels[first:first+n_labels] + series[n_labels:]
+
+		leg = self.axes[i].legend( source.lines[n_start-( 1 if self.args.abscissa else 0 ):n_end], labels, frameon=self.args.plain )
+		for text in leg.get_texts() :
+			text.set_color( self.legends_color )
+		self.axes[i].xaxis.label.set_color( self.labels_color )
+
+
+	def _zero_sight( self ) :
+		"Autoscale the axes and return True if their limits have changed."
+
+		bounds = [ ax.viewLim.bounds for ax in self.axes ] if self._blit else None
+
+		for source in self._sources :
+			if not source.lines :
+				continue
+
+			if self.args.abscissa :
+				xlim = source.limits[0]
+			elif source.stamped :
+				xlim = source.limits[-1]
+			elif source.count_displayed > 0 :
+				xlim = 0, source.count_displayed - 1
+			else :
+				xlim = None
+
+			n = 0
+			for i, subplot in enumerate( source.series, source.subplot ) :
+				ax = self.axes[i]
+				zero = self.args.zero is not None and ( self.args.zero[0] == 0 or i + 1 in self.args.zero )
+				ylim = ( 0, 0 ) if zero else None
+				for serie in subplot :
+					if n > 0 or not self.args.abscissa :
+						limits = source.limits[n]
+						if limits is not None :
+							ylim = limits if ylim is None else ( min( ylim[0], limits[0] ), max( ylim[1], limits[1] ) )
+					n += 1
+				if xlim is not None and ylim is not None :
+					ax.dataLim.set_points( np.array( [ [ xlim[0], ylim[0] ], [ xlim[1], ylim[1] ] ], np.float64 ) )
+				ax.autoscale( True )
+
+		return bounds is None or bounds != [ ax.viewLim.bounds for ax in self.axes ]
+
+
+	def _plot_data( self, source ) :
+		"""
+		Create the lines of a source whose series are known.
+
+		The series of all the sources are numbered in the order they are plotted for the labels and the line styles.
+		"""
+
+		if self.args.titles is None :
+			self.axes[0].set_title( self._counter() )
+
+		source.first = self._nplotted
+		self._nplotted += source.nseries
+
+		data, limits, ordered = self._snapshot( source )
+
+		n = 0
+		g = source.first
+		if self.args.abscissa :
+			for i, subplot in enumerate( source.series, source.subplot ) :
+				if i and not self.args.loop :
+					self.axes[i]._get_lines.prop_cycler = self.axes[i-1]._get_lines.prop_cycler
+				for serie in subplot :
+					if n :
+						source.lines += self.axes[i].plot( data[0], data[n], ls=self._linestyle( g ), animated=self._blit )
+						if self.args.linewidth is not None and len( self.args.linewidth ) >= g :
+							source.lines[n-1].set_linewidth( self.args.linewidth[g-1] )
+						else :
+							source.lines[n-1].set_linewidth( self.lines_width )
+					n += 1
+					g += 1
+				shift = 0 if i > source.subplot else 1
+				if len( subplot ) > shift + 1 :
+					self._legend( source, i, subplot[shift:], n )
+				elif len( self.args.labels ) > g - 1 :
+					self.axes[i].set_ylabel( self.args.labels[g-1], color=self.labels_color )
+				else :
+					self.axes[i].set_ylabel( subplot[shift], color=self.labels_color )
+			if len( self.args.labels ) > source.first :
+				self.axes[i].set_xlabel( self.args.labels[source.first], color=self.labels_color )
+			else :
+				self.axes[i].set_xlabel( source.series[0][0], color=self.labels_color )
+				
+		else :
+			for i, subplot in enumerate( source.series, source.subplot ) :
+				if i and not self.args.loop :
+					self.axes[i]._get_lines.prop_cycler = self.axes[i-1]._get_lines.prop_cycler
+				for serie in subplot :
+					source.lines += self.axes[i].plot( data[n], ls=self._linestyle( g + 1 ), animated=self._blit )
+					if self.args.linewidth is not None and len( self.args.linewidth ) > g :
+						source.lines[n].set_linewidth( self.args.linewidth[g] )
+					else :
+						source.lines[n].set_linewidth( self.lines_width )
+					n += 1
+					g += 1
+				if len( subplot ) > 1 :
+					self._legend( source, i, subplot, n )
+				elif len( self.args.labels ) > g - 1 :
+					self.axes[i].set_ylabel( self.args.labels[g-1], color=self.labels_color )
+				else :
+					self.axes[i].set_ylabel( subplot[0], color=self.labels_color )
+			if self.args.xlabel is not None :
+				self.axes[i].set_xlabel( self.args.xlabel, color=self.labels_color )
+			else :
+				self.axes[i].xaxis.label.set_color( self.labels_color )
+
+		source.lines_data = [ None ]*len( source.lines )
+		source.decimation_ranges = [ None ]*len( source.lines )
+		self._update_lines( source, data, limits, ordered )
+
+		if not self.args.abscissa :
+			self._zero_sight()
+
+
+	def _update_lines( self, source, data, limits, ordered ) :
+		"""
+		Set the data of the lines of a source from the list of its series and keep their limits for the autoscale.
+		'ordered' tells whether the first series is sorted, which allows the decimation when it is the abscissa.
+		"""
+
+		source.limits = limits
+		source.count_displayed = len( data[0] )
+		source.sorted_x = not self.args.abscissa or ordered
+
+		if self._fromfile and not self.args.nodecimation and len( data[0] ) >= self.PYRAMID_THRESHOLD :
+			if source.pyramids is None or len( source.pyramids[-1].levels[0][0] ) != len( data[0] )//_Pyramid.BASE :
+				source.pyramids = self._pyramids( source, data )
+		else :
+			source.pyramids = None
+
+		if self.args.abscissa :
+			for i in range( 1, source.nseries ) :
+				self._set_line_data( source, i - 1, data[0], data[i] )
+
+		elif source.stamped :
+			for i in range( source.nseries ) :
+				self._set_line_data( source, i, data[-1], data[i] )
+
+		else :
+			n = len( data[0] )
+			if len( self._abscissa_range ) < n :
+				self._abscissa_range = np.arange( max( n, 2*len( self._abscissa_range ) ) )
+			for i in range( source.nseries ) :
+				self._set_line_data( source, i, self._abscissa_range[:n], data[i] )
+
+
+	def _set_line_data( self, source, k, x, y, xlim=None ) :
+		"""
+		Set the data of the k-th line of a source, decimated according to the width in pixels of its axes.
+
+		If 'xlim' is specified, only the data around these limits are kept.
+		"""
+
+		source.lines_data[k] = x, y
+		line = source.lines[k]
+
+		if not self.args.nodecimation and len( x ) > 1 :
+			width = max( 1, int( line.axes.bbox.width ) )
+
+			sorted_x = source.sorted_x
+
+			if xlim is None :
+				xlim = x[0], x[-1]
+			else :
+				span = xlim[1] - xlim[0]
+				xlim = xlim[0] - span/2, xlim[1] + span/2
+				width *= 2
+
+			if sorted_x :
+				source.decimation_ranges[k] = xlim
+				pyramid = source.pyramids[k+1 if self.args.abscissa else k] if source.pyramids is not None else None
+				x, y = self._decimate( x, y, xlim, width, pyramid )
+			else :
+				source.decimation_ranges[k] = None
+
+		line.set_data( x, y )
+
+
+	def _decimate( self, x, y, xlim, width, pyramid=None ) :
+		"""
+		Keep the data between the limits 'xlim' and reduce them to the minimum
+		and the maximum of each half pixel column if there are more than four points per pixel,
+		placed at their own abscissas and in their own order.
+
+		The abscissas 'x' have to be sorted in increasing order.
+		If the pyramid of extrema of 'y' is specified, the blocks are taken from its coarsest level
+		that still gives at least one block per half pixel column, so that the cost only depends on the width.
+		"""
+
+		if x.dtype.kind in 'iu' :
+			# LES LIMITES SONT ARRONDIES POUR QUE LA RECHERCHE NE CONVERTISSE PAS TOUTES LES ABSCISSES EN FLOTTANTS :
+			lower, upper = np.clip( xlim, x[0] - 1, x[-1] + 1 )
+			xlim = x.dtype.type( np.ceil( lower ) ), x.dtype.type( np.floor( upper ) )
+
+		start = max( 0, np.searchsorted( x, xlim[0], 'left' ) - 1 )
+		end = min( len( x ), np.searchsorted( x, xlim[1], 'right' ) + 1 )
+
+		if end - start <= 4*width :
+			return x[start:end], y[start:end]
+
+		step = ( end - start )//( 2*width )
+
+		if pyramid is not None and step >= pyramid.BASE :
+			level, size = pyramid.level( step )
+			group = step//size
+			step = size*group
+			first = -( -start//size )
+			count = ( end//size - first )//group
+			minima, maxima, lowest, highest = _Pyramid.reduce( [ array[first:first+count*group] for array in level ], group )
+			begin = first*size
+		else :
+			begin = start
+			count = ( end - start )//step
+			blocks = y[start:start+count*step].reshape( -1, step )
+			offsets = np.arange( begin, begin + count*step, step )
+			lowest = blocks.argmin( 1 ) + offsets
+			highest = blocks.argmax( 1 ) + offsets
+		stop = begin + count*step
+
+		# CHAQUE EXTREMUM EST PLACÉ À SA PROPRE ABSCISSE, LE PREMIER DES DEUX AVANT L'AUTRE :
+		earlier = np.minimum( lowest, highest )
+		later = np.maximum( lowest, highest )
+
+		head = begin - start
+		decimated_x = np.empty( head + 2*count + end - stop, x.dtype )
+		decimated_y = np.empty( len( decimated_x ), y.dtype )
+		decimated_x[:head] = x[start:begin]
+		decimated_y[:head] = y[start:begin]
+		decimated_x[head:head+2*count:2] = x[earlier]
+		decimated_x[head+1:head+2*count:2] = x[later]
+		decimated_y[head:head+2*count:2] = y[earlier]
+		decimated_y[head+1:head+2*count:2] = y[later]
+		decimated_x[head+2*count:] = x[stop:end]
+		decimated_y[head+2*count:] = y[stop:end]
+
+		return decimated_x, decimated_y
+
+
+	def _on_xlim_changed( self, ax ) :
+		"Decimate again the data of a still figure when the view changes."
+
+		if self.args.nodecimation or not ( self._paused or self._ended or self._fromfile ) :
+			return
+
+		xlim = ax.get_xlim()
+		span = xlim[1] - xlim[0]
+
+		for source in self._sources :
+			for k, line in enumerate( source.lines ) :
+				if line.axes is ax and source.lines_data[k] is not None :
+					limits = source.decimation_ranges[k]
+					if limits is not None and limits[0] <= xlim[0] and xlim[1] <= limits[1] and 2*span >= limits[1] - limits[0] :
+						continue
+					self._set_line_data( source, k, *source.lines_data[k], xlim=xlim )
+
+
+	def _relim_data( self ) :
+
+		self._data_count = 0
+		for source in self._sources :
+			if source.store is not None :
+				source.store.trim( self.args.band )
+				self._data_count = max( self._data_count, len( source.store ) )
 
-	def _s_positive_int( self, arg ) :
-		try :
-			s_positive_int = int( arg )
-			assert s_positive_int > 0
-		except :
-			raise argparse.ArgumentTypeError( "invalid strictly positive int value: '%s'" % arg )
-		return s_positive_int
 
+	def _counter( self ) :
+		"Return the amount of data of each source in square brackets."
 
-	def _columns( self, arg ) :
-		try :
-			columns = []
-			for subplot in arg.split( '/' ) :
-				columns.append( [] )
-				for column in subplot.split( ',' ) :
-					column_range = column.split( ':' )
+		return '[ %s ]' % ' | '.join( str( len( source.store ) if source.store is not None else 0 ) for source in self._sources )
 
-					assert len( column_range ) <= 3
 
-					if len( column_range ) == 3 :
-						step = int( column_range[2] )
-					else :
-						step = 1
+	def _snapshot( self, source, evicted=False ) :
+		"""
+		Return views on the series of a source, their limits and whether the first one is sorted,
+		followed by the number of data evicted before them if 'evicted' is True.
 
-					if len( column_range ) >= 2 :
-						start = int( column_range[0] )
-						if column_range[1][0] == 'x' :
-							stop  = start + step*( abs( int( column_range[1][1:] ) ) - 1 )
-							order = 1 if step >= 0 else -1
-						else :
-							stop  = int( column_range[1] )
-							order = 1 if start <= stop else -1
-						columns[-1].extend( range( start, stop + order, order*abs( step ) ) )
-					else :
-						columns[-1].append( int( column_range[0] ) )
+		The lock is only held while they are taken since the views remain valid while new data are appended.
+		"""
 
-		except :
-			raise argparse.ArgumentTypeError( "invalid columns list: '%s': must be integers separeted by commas, slashes or colons to indicate a range" % arg )
-		return columns
+		self._acquire()
+		data = [ source.store.series( i ) for i in range( source.nseries + source.stamped ) ]
+		limits = [ source.store.limits( i ) for i in range( source.nseries + source.stamped ) ]
+		ordered = source.store.sorted
+		count = source.store.evicted
+		self._data_mutex.release()
 
+		if evicted :
+			return data, limits, ordered, count
+		return data, limits, ordered
 
-	def _indexes( self, arg ) :
-		try :
-			indexes = arg.split( ',' )
-			for i, index in enumerate( indexes ) :
-				indexes[i] = int( index )
-				assert indexes[i] > 0
-		except :
-			raise argparse.ArgumentTypeError( "invalid list: '%s': must be integers separeted by commas" % arg )
-		return indexes
 
+	def redraw_data( self, msg='' ) :
+		"""
+		Update the figure from the read data. It has to be called from the thread of the GUI.
 
-	def _float_list( self, arg ) :
-		try :
-			floats = arg.split( ',' )
-			for i, value in enumerate( floats ) :
-				if value == '' :
-					floats[i] = self.lines_width
+		The string as argument is written on top of the number of data if no title has been specified.
+		"""
+
+		start = time.perf_counter_ns()
+
+		self._acquire()
+		self._relim_data()
+		self._data_mutex.release()
+
+		if self.args.titles is None :
+			self.axes[0].set_title( '%s\n%s' % ( msg, self._counter() ) )
+
+		if self._new_data :
+			for source in self._sources :
+				if not source.lines :
+					continue
+				if self._paused :
+					if source.backup is not None :
+						self._update_lines( source, source.backup, source.limits_backup, source.sorted_backup )
 				else :
-					floats[i] = float( value )
-		except :
-			raise argparse.ArgumentTypeError( "invalid list: '%s': must be floats separeted by commas" % arg )
-		return floats
+					self._update_lines( source, *self._snapshot( source ) )
 
+			rescaled = self._zero_sight()
 
-	def _percentage( self, arg ) :
-		try :
-			percentage = float( arg )
-			assert percentage >= 0 and percentage <= 100
-		except :
-			raise argparse.ArgumentTypeError( "invalid percentage value: '%s'" % arg )
-		return percentage
+			self._new_data = False
 
+			if rescaled :
+				self._backgrounds = None
+				if self.fig.canvas.toolbar is not None :
+					self.fig.canvas.toolbar.update()
+					self.fig.canvas.toolbar.push_current()
 
-	def _size( self, arg ) :
+		if not self._blit_data() :
+			self.fig.canvas.draw_idle()
+
+		self._frames += 1
+		self._redraw_ns += time.perf_counter_ns() - start
+
+
+	def _acquire( self ) :
+		"Acquire the lock on the data, counting the time waited for it."
+
+		import threading
+
+		start = time.perf_counter_ns()
+		self._data_mutex.acquire()
+		thread = threading.get_ident()
+		self._lock_waits_ns[thread] = self._lock_waits_ns.get( thread, 0 ) + time.perf_counter_ns() - start
+
+
+	def _plot_sources( self ) :
+		"Create the lines of the sources whose series have been found, once the regular files have been entirely read."
+
+		for source in self._sources :
+			if source.series is not None and source.first is None and ( source.ended or not source.fromfile ) :
+				self._plot_data( source )
+				self._new_data = True
+
+
+	def _on_timer( self ) :
+		"""
+		Render on the thread of the GUI the data published by the reading thread since the last frame,
+		which is known from the generation counter the reading thread increments after each append.
+		"""
+
+		if self._timer.interval != int( self._period*1e3 ) :
+			self._timer.interval = int( self._period*1e3 )
+
+		if self._worker :
+			self._receive()
+
+		self._schedule()
+		refreshed = self._sample_stats()
+
+		self._plot_sources()
+
+		generation = self._generation
+		if generation == self._drawn_generation :
+			if refreshed and not self._blit_data() :
+				self.fig.canvas.draw_idle()
+			return
+		self._drawn_generation = generation
+
+		if self._ended :
+			self._timer.stop()
+			self._sample_stats( force=True )
+			if not self._paused :
+				self._end()
+			return
+
+		self._new_data = True
+
+		overrun = self._overrun()
+		if overrun :
+			self._overruns += 1
+		if not self._paused :
+			self.redraw_data( '%.1f FPS - LAG %.2f s' % ( 1/max( self._period, 1e-3 ), self._lag ) if overrun or self._period > self.args.rate else '' )
+
+
+	def _schedule( self ) :
+		"""
+		Choose the period of the frames from the costs of drawing and parsing measured since the previous tick.
+
+		The cost of a frame is the processor time of the thread of the GUI, which includes the deferred rendering.
+		The ingestion lag is the time that parsing the bytes waiting in the streams would take.
+		While it is longer than a period or the reading has not caught up with the streams,
+		the frames are spaced out up to --maxperiod, and brought back to --rate once it has.
+		In any case, drawing takes no more than 1 - READING_SHARE of the time.
+		"""
+
+		totals = time.monotonic(), time.thread_time(), self._frames, self._counters[0], self._counters[4], self._counters[5]
+		if self._schedule_totals is None :
+			self._schedule_totals = totals
+			return
+		elapsed, cpu, frames, nbytes, parse_ns, catchups = ( now - previous for now, previous in zip( totals, self._schedule_totals ) )
+		if elapsed <= 0 :
+			return
+		self._schedule_totals = totals
+
+		if frames > 0 :
+			self._frame_cost = 0.8*self._frame_cost + 0.2*cpu/frames
+		if nbytes > 0 :
+			self._byte_cost = parse_ns/1e9/nbytes
+		self._lag = self._buffered_bytes()*self._byte_cost
+
+		fastest = max( self.args.rate, self._frame_cost/( 1 - self.READING_SHARE ) )
+		slowest = max( self.args.rate, self.args.maxperiod )
+		if self._lag > self._period or ( catchups == 0 and nbytes > 0 ) :
+			self._period = min( slowest, max( fastest, 1.5*self._period ) )
+		else :
+			self._period = min( slowest, max( fastest, self._period/1.5 ) )
+
+
+	def _overrun( self ) :
+		"""
+		Return True if the data have come faster than they are drawn: with a worker,
+		when more data than the band or the window holds have been published since the previous frame,
+		otherwise when the reading thread has not caught up with the inputs since then.
+		"""
+
+		if not self._worker :
+			overrun = not self._caught_up
+			self._caught_up = False
+			return overrun
+
+		overruns = [ source.store.lag() > len( source.store ) for source in self._sources if source.store is not None ]
+		return any( overruns )
+
+
+	def _sample_stats( self, force=False ) :
+		"""
+		Once every stats period, write the performance counters as a JSON line into the file given by --stats
+		and show them in the overlay if it is visible, the rates being computed since the previous sample.
+
+		Return True if the overlay has been updated.
+		"""
+
+		if self._stats_file is None and not self._overlay.get_visible() :
+			return False
+
+		now = time.monotonic()
+		if not force and now < self._stats_time + self.stats_period :
+			return False
+
+		totals = dict( zip( self.COUNTERS, self._counters.tolist() ) )
+		totals.update( frames=self._frames, overruns=self._overruns, redraw_ns=self._redraw_ns, lock_wait_ns=sum( list( self._lock_waits_ns.values() ) ) )
+		delta = { key : value - self._stats_totals.get( key, 0 ) for key, value in totals.items() }
+		elapsed = max( now - self._stats_time, 1e-9 )
+		self._stats_time, self._stats_totals = now, totals
+
+		stats = { 'time': round( time.time(), 3 ),
+		          'interval_s': round( elapsed, 3 ),
+		          'lines': totals['lines'],
+		          'lines_per_s': round( delta['lines']/elapsed, 1 ),
+		          'accepted_per_s': round( delta['accepted']/elapsed, 1 ),
+		          'rejected_per_s': round( delta['rejected']/elapsed, 1 ),
+		          'shed_per_s': round( delta['shed']/elapsed, 1 ),
+		          'bytes_per_s': round( delta['bytes']/elapsed, 1 ),
+		          'bytes_buffered': self._buffered_bytes(),
+		          'parse_ms': round( delta['parse_ns']/1e6, 3 ),
+		          'frames': delta['frames'],
+		          'frames_dropped': delta['overruns'],
+		          'redraw_ms': round( delta['redraw_ns']/1e6/delta['frames'], 3 ) if delta['frames'] > 0 else None,
+		          'frame_cost_ms': round( self._frame_cost*1e3, 3 ),
+		          'frame_period_ms': round( self._period*1e3, 1 ),
+		          'ingestion_lag_s': round( self._lag, 3 ),
+		          'lock_wait_ms': round( delta['lock_wait_ns']/1e6, 3 ),
+		          'store_bytes': self._store_bytes() }
+
+		if self._stats_file is not None :
+			try :
+				self._stats_file.write( json.dumps( stats ) + '\n' )
+			except OSError :
+				self._stats_file = None
+
+		if not self._overlay.get_visible() :
+			return False
+
+		self._overlay.set_text( '\n'.join( '%-15s %s' % ( key, value ) for key, value in stats.items() if key != 'time' ) )
+		return True
+
+
+	def _buffered_bytes( self ) :
+		"Return the number of bytes waiting to be read in the streams."
+
+		return sum( _pending_bytes( source.fd ) for source in self._sources if not source.fromfile and not source.ended and source.listening is None )
+
+
+	def _store_bytes( self ) :
+		"Return the memory allocated by the stores."
+
+		return sum( source.store.nbytes for source in self._sources if source.store is not None )
+
+
+	def toggle_stats( self ) :
+		"Show or hide the overlay of the performance counters."
+
+		self._overlay.set_visible( not self._overlay.get_visible() )
+		if self._overlay.get_visible() :
+			self._sample_stats( force=True )
+		if not self._blit_data() :
+			self.fig.canvas.draw_idle()
+
+
+	def _receive( self ) :
+		"""
+		Read the generation published by the worker and apply the messages it has sent before,
+		then send it the band if it has been changed.
+		"""
+
+		if self._control is None :
+			return
+
+		generation = int( self._shared[0] )
+
+		ended = False
 		try :
-			size = arg.split( 'x' )
-			size[0] = float( size[0] )
-			size[1] = float( size[1] )
-			assert len( size ) == 2 and size[0] > 0 and size[1] > 0 and size[0] <= 100 and size[1] <= 100
-		except :
-			raise argparse.ArgumentTypeError( "invalid size: '%s': must be of the form 'WIDTH(%)xHEIGHT(%)'" % arg )
-		return size
+			while not ended and self._control.poll() :
+				message = self._control.recv()
+				if message[0] == 'series' :
+					self._set_series( self._sources[message[1]], message[2] )
+				elif message[0] == 'segment' :
+					self._sources[message[1]].store.attach( *message[2:] )
+				elif message[0] == 'ended' :
+					self._sources[message[1]].ended = True
+				else :
+					ended = True
+		except ( EOFError, OSError ) :
+			ended = True
+
+		self._relim_data()
+
+		if ended :
+			self._control.close()
+			self._control = None
+			os.waitpid( self._worker, 0 )
+			self._ended = True
+			self._generation = int( self._shared[0] ) + 1
+			return
 
+		if self._band != self.args.band :
+			self._band = self.args.band
+			self._control.send( self._band )
 
-	def _str_list( self, arg ) :
-		return arg.split( ',' )
+		self._generation = generation
 
-	
-	def __init__( self, args=None, input=None,
-	              
-				  # PÉRIODE DE RAFRAÎCHISSEMENT PAR DÉFAUT :
-				  rate = 0.05,
 
-                  # TAILLE DE LA FENÊTRE PAR DÉFAUT :
-                  w = 650,
-                  h = 524,
+	def _on_draw( self, event ) :
+		"""
+		Start the rendering timer on the canvas at the first redraw,
+		then save the background of each axes after each full redraw and draw the animated artists.
+		"""
 
-                  # COULEURS DE LA FIGURE :
-                  face_color = '0.25',
-                  background_color = '0.5',
-                  grid_color = 'w',
-                  axis_color = '0.9',
-                  ticks_color = '0.9',
-                  labels_color = '0.9',
-                  title_color = '0.7',
-                  legends_color = '0.9',
-                  edge_color = 'k',
+		from matplotlib.transforms import Bbox
 
-                  # ÉPAISSEUR DES COURBES PAR DÉFAUT :
-                  lines_width = 1.0,
+		if self._timer is None and not self._fromfile :
+			self._timer = event.canvas.new_timer( interval=int( self.args.rate*1e3 ) )
+			self._timer.add_callback( self._on_timer )
+			self._timer.start()
+
+		if self._writer is not None :
+			self._writer.put( np.asarray( event.canvas.buffer_rgba() ).copy() )
+
+		if not self._blit :
+			return
+
+		canvas = self.fig.canvas
+
+		self._backgrounds = []
+		if getattr( canvas, 'supports_blit', False ) :
+			self._backgrounds_size = self.fig.bbox.bounds
+			for i, ax in enumerate( self.axes ) :
+				bbox = ax.bbox
+				if i == 0 :
+					bbox = Bbox.from_extents( self.fig.bbox.x0, bbox.y0, self.fig.bbox.x1, self.fig.bbox.y1 )
+				self._backgrounds.append( ( bbox, canvas.copy_from_bbox( bbox ) ) )
+
+		self._draw_animated( event.renderer )
+
+
+	def _draw_animated( self, renderer ) :
+
+		for ax in self.axes :
+			for line in ax.lines :
+				if line.get_animated() :
+					line.draw( renderer )
+		self.axes[0].title.draw( renderer )
+		if self._overlay.get_visible() :
+			self._overlay.draw( renderer )
+
+
+	def _blit_data( self ) :
+		"""
+		Redraw only the animated artists over the saved backgrounds.
+
+		Return False if a full redraw is needed.
+		"""
+
+		canvas = self.fig.canvas
+
+		if not self._blit or not self._backgrounds or self._backgrounds_size != self.fig.bbox.bounds or canvas.widgetlock.locked() :
+			return False
+
+		for bbox, background in self._backgrounds :
+			canvas.restore_region( background )
+		self._draw_animated( canvas.get_renderer() )
+		for bbox, background in self._backgrounds :
+			canvas.blit( bbox )
+
+		return True
+
+
+	def _read_block( self, connection ) :
+		"""
+		Return the complete lines available on a connection as a block of bytes, reading at most one chunk.
+
+		The block is empty if no line has been completed and None is returned at the end of the file.
+		Raise an OSError if no data are available.
+		"""
+
+		chunk = os.read( connection.fd, self.chunk_size )
+
+		if not chunk :
+			block, connection.tail = connection.tail, b''
+			return block + b'\n' if block and self.args.binary is None else None
+
+		data = connection.tail + chunk
+		if self.args.binary is None :
+			end = data.rfind( b'\n' ) + 1
+		else :
+			end = len( data ) - len( data )%self.args.binary.itemsize
+
+		connection.tail = data[end:]
+		return data[:end]
+
+
+	def _skip_to_newest( self, connection ) :
+		"""
+		If the reading of a connection is behind, discard the complete lines or records waiting on it
+		but those of the last quarter of a chunk, and count them as shed.
+		They are still written on the standard output if the option pass is set, but since they are not parsed,
+		those which would be rejected are not written otherwise.
+		"""
+
+		pending = _pending_bytes( connection.fd )
+		if pending < self.BACKLOG*self.chunk_size :
+			return
+		count = pending - self.chunk_size//4
+
+		data = connection.tail + os.read( connection.fd, count )
+		if self.args.binary is None :
+			end = data.rfind( b'\n' ) + 1
+			shed = data.count( b'\n', 0, end )
+		else :
+			end = len( data ) - len( data )%self.args.binary.itemsize
+			shed = end//self.args.binary.itemsize
+
+		connection.tail = data[end:]
+		self._counters[6] += shed
+
+		if self.args.reprint :
+			_write_out( [ memoryview( data )[:end] ] )
+
+
+	def _adapt_shedding( self, source, fd ) :
+		"Double the shedding factor of a source while its reading is behind and halve it once nothing is waiting on its stream."
+
+		pending = _pending_bytes( fd )
+		if pending >= self.BACKLOG*self.chunk_size :
+			source.shedding = min( 2*source.shedding, self.SHEDDING_MAX )
+		elif pending == 0 :
+			source.shedding = max( 1, source.shedding//2 )
+
+
+	def _decimate_block( self, source, block ) :
+		"""
+		Keep one line or record out of the shedding factor of a source in a block, before it is parsed,
+		and count the others as shed. The selection goes on from one block to the next.
+		The lines left out are not parsed, so that those which would be rejected are not written either.
+		"""
+
+		n = source.shedding
+		data = np.frombuffer( block, np.uint8 )
+
+		if self.args.binary is not None :
+			records = data.reshape( -1, self.args.binary.itemsize )
+			count = len( records )
+			kept = records[( -source.phase )%n::n]
+			shed = count - len( kept )
+		else :
+			ends = np.flatnonzero( data == 10 ) + 1
+			starts = np.concatenate( ( [ 0 ], ends[:-1] ) )
+			count = len( ends )
+			selected = slice( ( -source.phase )%n, None, n )
+			lengths = ends[selected] - starts[selected]
+			offsets = np.repeat( starts[selected] - np.cumsum( lengths ) + lengths, lengths )
+			kept = data[offsets + np.arange( len( offsets ) )]
+			shed = count - len( lengths )
+
+		source.phase = ( source.phase + count )%n
+		self._counters[6] += shed
+		return kept.tobytes()
+
+
+	def _aggregate( self, source, rows ) :
+		"""
+		Replace each bucket of rows of the size of the shedding factor of a source by their minimums, means and maximums,
+		and count the others as shed.
+
+		The series taken as abscissa are not aggregated but take the first, middle and last values of each bucket,
+		so that they remain in order.
+		"""
+
+		n = source.shedding
+		end = len( rows )//n*n
+		buckets = rows[:end].reshape( -1, n, rows.shape[1] )
+
+		aggregated = np.empty( ( 3*len( buckets ) + len( rows ) - end, rows.shape[1] ), rows.dtype )
+		aggregated[:3*len( buckets ):3] = buckets.min( 1 )
+		aggregated[1:3*len( buckets ):3] = buckets.mean( 1 )
+		aggregated[2:3*len( buckets ):3] = buckets.max( 1 )
+		aggregated[3*len( buckets ):] = rows[end:]
+
+		abscissas = self._abscissas( source )
+		if abscissas :
+			aggregated[:3*len( buckets ):3,abscissas] = buckets[:,0,abscissas]
+			aggregated[1:3*len( buckets ):3,abscissas] = buckets[:,n//2,abscissas]
+			aggregated[2:3*len( buckets ):3,abscissas] = buckets[:,-1,abscissas]
+
+		self._counters[6] += len( rows ) - len( aggregated )
+		return aggregated
+
+
+	def _abscissas( self, source ) :
+		"Return the positions among the parsed series of a source of those taken as abscissa, by this tracer or by the figures it feeds."
+
+		if not self._figures :
+			return [ 0 ] if self.args.abscissa else []
+
+		k = self._sources.index( source )
+		positions = set()
+		for figure in self._figures :
+			if figure.args.abscissa :
+				target = figure._sources[k]
+				positions.add( int( target.selection[0] ) if target.selection is not None else 0 )
+		return sorted( positions )
+
+
+	def _read_datagram( self, source ) :
+		"""
+		Return a datagram received by a listening source as a whole block of lines or records.
+
+		Raise an OSError if no datagram is available.
+		"""
+
+		datagram = source.file.recv( 65535 )
+
+		if self.args.binary is None :
+			return datagram if datagram.endswith( b'\n' ) or not datagram else datagram + b'\n'
+		return datagram[:len( datagram ) - len( datagram )%self.args.binary.itemsize]
+
+
+	def _set_series( self, source, series ) :
+
+		source.nseries = sum( len( subplot ) for subplot in series )
+		source.seriesmax = max( max( map( abs, subplot ) ) for subplot in series )
+
+		indexes = [ serie - 1 if serie > 0 else serie for subplot in series for serie in subplot ]
+		source.indexes = np.array( indexes )
+		if self.args.binary is not None :
+			source.fields = [ self.args.binary.names[index] for index in indexes ]
+		if len( indexes ) > 1 :
+			source.select = operator.itemgetter( *indexes )
+		else :
+			source.select = lambda words : ( words[indexes[0]], )
 
-                  # COULEURS DES COURBES PAR DÉFAUT :
-				  lines_color = [ 'b', 'g', 'r', 'm', 'y', 'c' ] ) :
+		source.stamped = self.args.window is not None and not self.args.abscissa
 
-		"""
-		At the declaration, parse the argument from the command line
-		or from the string 'args' if specified.
+		self._notify( ( 'series', self._sources.index( source ), series ) )
+		if self._figures :
+			self._share_series( source, series )
+		else :
+			if self.args.archive is not None :
+				name = self._archive_prefix + 'input%i' % self._sources.index( source )
+				source.archive = _Archive( self.args.archive, name, series, self._dtype, create=not self._worker, stamped=source.stamped )
+			source.store = self._new_store( source )
+		source.series = series
 
-		You can directly specify a file object to use as input.
 
-		'rate' is the default minimum time in seconds between two updates,
-		'w' and 'h' are the default size of the window in pixels,
-		'lines_width' is the default width of the lines,
-		'lines_color' is a list of their default colors
-		and the other arguments are the figure's colors.
+	def _share_series( self, source, series ) :
+		"""
+		Give the series read from a source to the figures which take all of them,
+		and to the other ones the positions of their own series among them.
 		"""
 
-		self.progname = os.path.basename( sys.argv[0] )
+		k = self._sources.index( source )
+		columns = [ serie for subplot in series for serie in subplot ]
 
-		self.w = w
-		self.h = h
+		for figure in self._figures :
+			target = figure._sources[k]
+			if target.columns is None :
+				figure._set_series( target, series )
+			else :
+				target.selection = np.array( [ columns.index( serie ) for subplot in target.columns for serie in subplot ] )
 
-		self.x = None
-		self.y = None
 
-		self.lines_width = lines_width
-		self.lines_color = lines_color
+	def _new_store( self, source ) :
+		"Return a store for the series of a source, shared between the worker and the GUI process if any."
 
-		self.parser = argparse.ArgumentParser()
-		self.parser.add_argument( '--sep', type=str, help="set the delimiter string" )
-		self.parser.add_argument( '-C', '--columns', type=self._columns, help="specify the columns to be processed, separated by commas (a colon indicates a range and an extra colon specifies a step) while subplots are separated by slashes" )
-		self.parser.add_argument( '-n', '--ncolumns', type=self._s_positive_int, help="process only the lines with N columns" )
-		self.parser.add_argument( '-a', '--abscissa', action='store_true', help="take the first series as abscissa" )
-		self.parser.add_argument( '-f', '--file', type=argparse.FileType('r'), help="read from the file FILE" )
-		self.parser.add_argument( '-o', '--offset', type=self._s_positive_int, help="add a starting offset" )
-		self.parser.add_argument( '-b', '--band', type=self._s_positive_int, help="limit the number of data to display" )
-		self.parser.add_argument( '-r', '--rate', type=float, default=rate, help="set a minimum time in seconds between two updates of the window" )
-		self.parser.add_argument( '-q', '--quiet', action='store_true', help="silence unprocessed lines" )
-		self.parser.add_argument( '-p', '--pass', dest='reprint', action='store_true', help="rewrite the data on standard output" )
-		self.parser.add_argument( '-x', '--x_pos', type=self._percentage, help="position the window in a percentage relative to the width of the screen" )
-		self.parser.add_argument( '-y', '--y_pos', type=self._percentage, help="position the window in a percentage relative to the height of the screen" )
-		self.parser.add_argument( '-s', '--size', type=self._size, help="resize the window in percentages relative to the screen according to the format 'WIDTHxHEIGHT'" )
-		self.parser.add_argument( '-c', '--colors', type=self._str_list, default=self.lines_color, help="set the color cycle for the lines, separated by commas" )
-		self.parser.add_argument( '-l', '--loop', action='store_true', help="loop the colors at each subplots" )
-		self.parser.add_argument( '-d', '--dashed', type=self._indexes, help="declare dashed lines, separated by commas" )
-		self.parser.add_argument( '-t', '--dotted', type=self._indexes, help="declare dotted lines, separated by commas" )
-		self.parser.add_argument( '-m', '--mixed', type=self._indexes, help="declare mixed lines, separated by commas" )
-		self.parser.add_argument( '-w', '--linewidth', type=self._float_list, help="set the linewidths, separated by commas" )
-		self.parser.add_argument( '-z', '--zero', type=self._indexes, nargs='?', const=[0], help="declare subplots where to keep zero in sight, separated by commas or every one when not specified" )
-		self.parser.add_argument( '-g', '--nogrid', type=self._indexes, nargs='?', const=[0], help="declare subplots where not to display the grid, separated by commas or every one when not specified" )
-		self.parser.add_argument( '-L', '--labels', type=self._str_list, default=[], help="set the labels for each series, separated by commas" )
-		self.parser.add_argument( '-A', '--xlabel', type=str, help="set the label for the abscissa" )
-		self.parser.add_argument( '-T', '--titles', type=self._str_list, help="set the titles for each subplots, separated by commas" )
-		self.parser.add_argument( '-X', '--latex', action='store_true', help="use LaTeX for the texts" )
-		self.parser.add_argument( '-P', '--plain', action='store_true', help="set plain colors for the figure" )
-		self.parser.add_argument( '-S', '--transparent', action='store_true', help="set the margins transparent" )
-		self.parser.add_argument( '-Q', '--Qt4', action='store_true', help="use Qt4 as backend" )
-		self.parser.add_argument( '--ylog', type=self._indexes, nargs='?', const=[0], help="declare y axes where to use a log scale, separated by commas or every one when not specified" )
-		self.parser.add_argument( '--xlog', action='store_true', help="use a log scale for the x axis, which implies to take the first series as abscissa" )
+		nseries = source.nseries + source.stamped
+		clock = source.nseries if source.stamped else 0
 
+		if self._worker is None :
+			return _RingBuffer( nseries, self.args.band, self._dtype, archive=source.archive, window=self.args.window, clock=clock )
 
-		# LECTURE DES ARGUMENTS :
+		if self._worker == 0 :
+			k = self._sources.index( source )
+			return _SharedRingBuffer( nseries, self.args.band, self._dtype, lambda name, capacity : self._notify( ( 'segment', k, name, capacity ) ), source.archive, self.args.window, clock )
 
-		if args is not None :
-			self.args = self.parser.parse_args( args.split() )
-		else :
-			self.args = self.parser.parse_args()
+		return _SharedView( nseries, self._dtype )
 
-		if self.args.xlog :
-			self.args.abscissa = True
 
+	def _detect_series( self, source, strline ) :
 
-		# INITIALISATIONS :
+		line = strline.split( self.args.sep )
 
-		self._fromfile = False
-
-		if input is not None :
-			self.input = input
-			self.window_title = '%s (%i)' % ( self.progname, self.input.fileno() )
-		elif self.args.file is not None :
-			self.input = self.args.file
-			self.window_title = '%s (%s)' % ( self.progname, self.args.file.name )
-			mode = os.fstat( self.args.file.fileno() ).st_mode
-			if not stat.S_ISFIFO( mode ) and not stat.S_ISSOCK( mode ) :
-				self._fromfile = True
-		else :
-			self.window_title = self.progname + ' (stdin)'
+		if self.args.ncolumns is not None and len( line ) != self.args.ncolumns :
+			return False
 
-		if not self._fromfile :
-			import select
-			import fcntl
+		series = [[]]
+		for i, word in enumerate( line ) :
+			try :
+				float( word )
+			except ValueError :
+				continue
+			series[0].append( i + 1 )
 
-			self.input = sys.stdin
-			self._poll = select.poll()
-			self._poll.register( self.input, select.POLLIN )
-			fl = fcntl.fcntl( self.input, fcntl.F_GETFL )
-			fcntl.fcntl( self.input, fcntl.F_SETFL, fl | os.O_NONBLOCK )
+		if ( not self.args.abscissa and len( series[0] ) < 1 ) or ( self.args.abscissa and len( series[0] ) < 2 ) :
+			return False
 
-		sys.stdout = os.fdopen( sys.stdout.fileno(), 'w' )
+		self._set_series( source, series )
 
-		if self.args.columns is not None :
-			self._series = self.args.columns
-			self._nsubplots = len( self._series )
-			self._nseries = 0
-			for subplot in self._series :
-				self._nseries += len( subplot )
+		return True
 
-			self._data = [ [] for i in range( self._nseries ) ]
 
-		else :
-			self._series = None
-			self._nsubplots = 1
+	def _parse_uniform_block( self, source, block, ends ) :
+		"""
+		Try to convert a whole block of lines at once, which is possible only
+		if all the lines have the same number of numeric fields.
 
-		self._lines = []
+		Return None if the block has to be processed line by line.
+		"""
 
-		self._data_count = 0
-		self._perf = 1.
+		data = np.frombuffer( block, np.uint8 )
 
-		if self.args.plain :
-			self.face_color = 'w'
-			self.background_color = 'w'
-			self.grid_color = 'k'
-			self.axis_color = 'k'
-			self.ticks_color = 'k'
-			self.labels_color = 'k'
-			self.title_color = 'k'
-			self.legends_color = 'k'
-			self.edge_color = 'k'
+		if self.args.sep is None :
+			delimiters = data <= 32
+		elif len( self._sep ) == 1 and not self._sep.isspace() :
+			if b' ' in block or b'\t' in block :
+				return None
+			separators = data == self._sep[0]
+			delimiters = separators | ( data <= 32 )
 		else :
-			self.face_color = face_color
-			self.background_color = background_color
-			self.grid_color = grid_color
-			self.axis_color = axis_color
-			self.ticks_color = ticks_color
-			self.labels_color = labels_color
-			self.title_color = title_color
-			self.legends_color = legends_color
-			self.edge_color = edge_color
+			return None
 
-		self._paused = False
+		words = ~delimiters
+		words[1:] &= delimiters[:-1]
+		counts = np.diff( np.concatenate( ( [0], np.searchsorted( np.flatnonzero( words ), ends ) ) ) )
+		ncolumns = counts[0]
 
-		self._ended = False
+		if ( counts != ncolumns ).any() :
+			return None
+		if self.args.ncolumns is not None and ncolumns != self.args.ncolumns or ncolumns < source.seriesmax :
+			return None
 
+		if self.args.sep is not None :
+			fields = np.diff( np.concatenate( ( [0], np.searchsorted( np.flatnonzero( separators ), ends ) ) ) ) + 1
+			if ( fields != ncolumns ).any() :
+				return None
+			block = block.replace( self._sep, b' ' )
 
-		# VÉRIFICATION DE LA COHÉRENCE DES ARGUMENTS :
+		try :
+			values = np.fromstring( block, self._dtype, sep=' ' )
+		except ValueError :
+			return None
 
-		if self.args.abscissa :
-			n = 2
-			if self.args.columns is not None :
-				n = len( self.args.columns[0] )
-			elif self.args.ncolumns is not None :
-				n = self.args.ncolumns
-			if n < 2 :
-				self.parser.error( "there must be at least two series to process if one is put in the abscissa" )
+		if values.size != len( ends )*ncolumns :
+			return None
 
-		if self.args.columns is not None :
-			self._seriesmax = 0
-			for subplot in self.args.columns :
-				self._seriesmax = max( self._seriesmax, max( map( abs, subplot ) ) )
-			if self.args.ncolumns is not None and self.args.ncolumns < self._seriesmax :
-				self.parser.error( "the number of columns must be at least equal to the highest selected column" )
+		return values.reshape( -1, ncolumns )[:,source.indexes]
 
 
-	def run( self, show=True, fork=True ) :
+	def _parse_records( self, source, block, limit=None, echo=True ) :
 		"""
-		Create the figure and run the reading thread.
+		Convert the selected fields of a block of binary records of a source into an array with one row per record.
 
-		If show=True, the standard window is created and the method blocks.
-
-		If fork=True, the program will fork and the parent process is used for terminal handling.
+		The records are written on the standard output if the option pass is set, unless 'echo' is False.
+		If 'limit' is specified, the records following the limit-th one are discarded.
 		"""
 
+		records = np.frombuffer( block, self.args.binary )
+		output = []
 
-		# CRÉATION D'UN SOUS-PROCESSUS :
+		if source.offset is not None and source.offset > 0 :
+			first = min( source.offset, len( records ) )
+			source.offset -= first
+			if not self.args.quiet and first > 0 :
+				output.append( memoryview( block )[:first*self.args.binary.itemsize] )
+			records = records[first:]
+			block = block[first*self.args.binary.itemsize:]
 
-		if fork :
+		if limit is not None :
+			records = records[:limit]
 
-			child_pid = os.fork()
+		if self.args.reprint :
+			output.append( memoryview( block )[:len( records )*self.args.binary.itemsize] )
 
-			if child_pid != 0 :
+		if output and echo :
+			_write_out( output )
 
-				def ctrl_c_handler( signum, frame ) :
-					sys.stderr.write( '\r' )
-					try :
-						os.kill( child_pid, signal.SIGTERM )
-						signal.pause()
-					except OSError as e :
-						if e.errno == 3 :
-							pass
-						else :
-							raise
+		if len( records ) == 0 :
+			return None
 
-				def exited_child_handler( signum, frame ) :
-					os.waitpid( child_pid, os.WNOHANG )
+		if source.series is None :
+			self._set_series( source, [ list( range( 1, len( self.args.binary.names ) + 1 ) ) ] )
 
-				signal.signal( signal.SIGCHLD, exited_child_handler )
-				signal.signal( signal.SIGINT, ctrl_c_handler )
+		rows = np.empty( ( len( records ), source.nseries ), self._dtype )
+		for i, field in enumerate( source.fields ) :
+			rows[:,i] = records[field]
 
-				signal.pause()
+		return rows
 
-				sys.exit( 0 )
 
+	def _parse_block( self, source, block, limit=None, echo=True ) :
+		"""
+		Convert the selected columns of a block of lines of a source into an array with one row per accepted line.
 
-			signal.signal( signal.SIGINT, signal.SIG_IGN )
-			signal.signal( signal.SIGTSTP, signal.SIG_IGN )
+		The lines are written on the standard output according to the options quiet and pass, unless 'echo' is False.
+		If 'limit' is specified, the lines following the limit-th accepted one are discarded.
+		"""
 
+		if self.args.binary is not None :
+			return self._parse_records( source, block, limit, echo )
 
-		# CRÉATION DE LA FENÊTRE :
+		ends = np.flatnonzero( np.frombuffer( block, np.uint8 ) == 10 ) + 1
+		if not block.endswith( b'\n' ) :
+			ends = np.append( ends, len( block ) )
 
-		import matplotlib
-		if self.args.Qt4 :
-			matplotlib.use( 'Qt4Agg' )
-		import matplotlib.pyplot as pyplot
-		import threading
+		output = []
+		first = 0
 
+		if source.offset is not None and source.offset > 0 :
+			first = min( source.offset, len( ends ) )
+			source.offset -= first
+			if not self.args.quiet and first > 0 :
+				output.append( memoryview( block )[:ends[first-1]] )
 
-		self.backend = matplotlib.get_backend()
+		while source.series is None and first < len( ends ) :
+			start = ends[first-1] if first > 0 else 0
+			if self._detect_series( source, block[start:ends[first]].decode( 'utf-8', 'replace' ) ) :
+				break
+			if not self.args.quiet :
+				output.append( memoryview( block )[start:ends[first]] )
+			first += 1
 
-		if self.args.latex :
-			pyplot.rcParams['text.usetex']=True
+		if source.series is None or first == len( ends ) :
+			rows = None
 
-		if self._series is not None :
-			self.fig, self.axes = pyplot.subplots( self._nsubplots, sharex=True )
-			if self._nsubplots == 1 :
-				self.axes = [ self.axes ]
 		else :
-			self.fig, self.axes = pyplot.subplots()
-			self.axes = [ self.axes ]
+			start = ends[first-1] if first > 0 else 0
+			block, ends = block[start:], ends[first:] - start
 
-		self.fig.set_facecolor( self.face_color )
-		self.fig.set_edgecolor( self.edge_color )
+			rows = self._parse_uniform_block( source, block, ends )
 
-		if self.args.transparent :
-			self.fig.patch.set_alpha( 0 )
+			if rows is not None :
+				if limit is not None and len( rows ) > limit :
+					rows = rows[:limit]
+					block = block[:ends[limit-1]]
+				if self.args.reprint :
+					output.append( block )
 
-		if self.args.titles is None :
-			self.axes[0].set_title( '[ 0 ]' )
+			else :
+				lines = [ block[i:j] for i, j in zip( [0] + ends[:-1].tolist(), ends.tolist() ) ]
+				words = [ line.decode( 'utf-8', 'replace' ).split( self.args.sep ) for line in lines ]
 
-		for i in range( self._nsubplots ) :
+				if self.args.ncolumns is not None :
+					accepted = [ len( line ) == self.args.ncolumns for line in words ]
+				else :
+					accepted = [ len( line ) >= source.seriesmax for line in words ]
 
-			if self.args.titles is not None and len( self.args.titles ) > i :
-				self.axes[i].set_title( self.args.titles[i] )
-			self.axes[i].title.set_color( self.title_color )
+				selected = [ source.select( line ) for line, ok in zip( words, accepted ) if ok ]
 
-			self.axes[i].set_facecolor( self.background_color )
+				try :
+					rows = np.array( selected, self._dtype )
 
-			for spine in self.axes[i].spines.values() :
-				spine.set_color( self.axis_color )
+				except ValueError :
+					j = 0
+					for i, ok in enumerate( accepted ) :
+						if ok :
+							try :
+								[ float( word ) for word in selected[j] ]
+							except ValueError :
+								accepted[i] = False
+								del selected[j]
+								continue
+							j += 1
+					rows = np.array( selected, self._dtype )
 
-			self.axes[i].tick_params( axis='x', colors=self.ticks_color, which='both' )
-			self.axes[i].xaxis.get_offset_text().set_color( self.ticks_color )
-			self.axes[i].tick_params( axis='y', colors=self.ticks_color, which='both' )
-			self.axes[i].yaxis.get_offset_text().set_color( self.ticks_color )
+				rows = rows.reshape( -1, source.nseries )
 
-			if self.args.xlog :
-				self.axes[i].set_xscale( "symlog" )
-			if self.args.ylog is not None and ( self.args.ylog[0] == 0 or i + 1 in self.args.ylog ) :
-				self.axes[i].set_yscale( "symlog" )
+				if limit is not None and len( rows ) > limit :
+					last = [ i for i, ok in enumerate( accepted ) if ok ][limit-1] + 1
+					accepted, rows = accepted[:last], rows[:limit]
+					block, ends = block[:ends[last-1]], ends[:last]
 
-			isgrid = False if self.args.nogrid is not None and ( self.args.nogrid[0] == 0 or i + 1 in self.args.nogrid ) else True
-			self.axes[i].grid( color=self.grid_color, ls='dotted', alpha=0.3 )
-			self.axes[i].grid( isgrid )
-			self.axes[i].abscissa = self.axes[i].axhline( color=self.grid_color, ls='dashed', alpha=0.2, visible=isgrid )
+				if self.args.reprint and not self.args.quiet :
+					output.append( block )
+				elif self.args.reprint :
+					output.extend( self._line_runs( block, ends, np.array( accepted ) ) )
+				elif not self.args.quiet :
+					output.extend( self._line_runs( block, ends, ~np.array( accepted ) ) )
 
-			self.axes[i].set_prop_cycle( color=self.args.colors )
+		if output and echo :
+			_write_out( output )
 
-		if not self._fromfile and self._series is not None :
-			self._plot_data()
+		return rows
 
 
-		# AFFICHAGE DES DONNÉES :
+	def _line_runs( self, block, ends, selected ) :
+		"Return views on the runs of consecutive lines of a block which are selected by a boolean array."
 
-		self._data_mutex = threading.Lock()
+		edges = np.flatnonzero( np.diff( np.concatenate( ( [ False ], selected, [ False ] ) ).astype( np.int8 ) ) )
+		starts = np.concatenate( ( [ 0 ], ends[:-1] ) )
+		view = memoryview( block )
+		return [ view[starts[first]:ends[last-1]] for first, last in zip( edges[::2], edges[1::2] ) ]
 
-		if self._fromfile :
-			self._read_data()
-		else :
-			reading_thread = threading.Thread( target=self._read_data )
-			reading_thread.setDaemon( True )
-			reading_thread.start()
 
-		if show :
-			self.set_window( pyplot.get_current_fig_manager() )
-			pyplot.show()
+	def _parse( self, source, block, limit=None, echo=True ) :
+		"Parse a block with _parse_block and count its bytes, its lines or records and the time it took."
+
+		start = time.perf_counter_ns()
+		rows = self._parse_block( source, block, limit, echo )
+		elapsed = time.perf_counter_ns() - start
+
+		if self.args.binary is not None :
+			lines = len( block )//self.args.binary.itemsize
 		else :
-			self.set_window()
+			lines = block.count( b'\n' ) + ( not block.endswith( b'\n' ) )
+		accepted = len( rows ) if rows is not None else 0
+		self._counters[:5] += ( len( block ), lines, accepted, lines - accepted, elapsed )
 
-		return 0
+		return rows
 
 
-	def set_window( self, fig_manager=None ) :
+	def _end( self ) :
+		self._new_data = True
+		if self._data_count == 0 :
+			self.redraw_data( 'ENDED WITH NO DATA' )
+		else :
+			self.redraw_data( 'ENDED' )
+
+
+	def _line_index( self, source ) :
 		"""
-		Calculate w, h, x and y according to the screen size.
+		Return an array of the positions following every INDEX_STEP-th line of the memory-mapped file of a source.
 
-		If a figure manager is given, it will try to set these parameters.
+		The index is built by a bulk scan of the file and cached next to it if its path is known.
 		"""
 
-		if fig_manager is not None :
+		status = os.fstat( source.fd )
+		header = [ self.INDEX_MAGIC, self.INDEX_STEP, status.st_size, status.st_mtime_ns ]
+
+		cache = None
+		if source.path is not None :
+			directory, name = os.path.split( source.path )
+			cache = os.path.join( directory, '.' + name + '.tracer-index' )
 			try :
-				fig_manager.set_window_title( self.window_title )
-			except :
-				sys.stderr.write( self.progname + ": error: unable to rename the window\n" )
+				index = np.load( cache )
+				if index[:4].tolist() == header :
+					return index[4:]
+			except ( IOError, ValueError ) :
+				pass
+
+		index = [ np.array( header, np.int64 ) ]
+		carry = 0
+		for start in range( 0, len( source.mmap ), self.INDEX_CHUNK ) :
+			count = min( self.INDEX_CHUNK, len( source.mmap ) - start )
+			ends = np.flatnonzero( np.frombuffer( source.mmap, np.uint8, count, start ) == 10 ) + start + 1
+			index.append( ends[self.INDEX_STEP-carry-1::self.INDEX_STEP] )
+			carry = ( carry + len( ends ) )%self.INDEX_STEP
+			del ends
+		index = np.concatenate( index )
+
+		if cache is not None :
+			try :
+				with open( cache + '.tmp', 'wb' ) as f :
+					np.save( f, index )
+				os.replace( cache + '.tmp', cache )
+			except OSError :
+				pass
 
-		if self.args.x_pos is not None or self.args.y_pos is not None or self.args.size is not None :
+		return index[4:]
 
-			if self.args.x_pos is None :
-				self.args.x_pos = 50
 
-			if self.args.y_pos is None :
-				self.args.y_pos = 50
+	def _pyramids( self, source, data ) :
+		"""
+		Return the pyramid of extrema of each series of a source read from a file, with None in place of the abscissa.
 
-			try :
-				screen_size = os.popen( "xrandr | grep \* | cut -d ' ' -f4" ).readline().split( 'x' )
-				w_screen = int( screen_size[0] )
-				h_screen = int( screen_size[1] )
-			except :
-				sys.stderr.write( self.progname + ": error: unable to get the screen size - window setting aborted\n" )
-				return
+		If the path of the file is known, the pyramids are cached next to it along with the size and the date of the file,
+		the number of data, the columns and the first and last values of each series.
+		"""
 
-			if self.args.size is not None :
-				self.w = self.args.size[0]*w_screen/100
-				self.h = self.args.size[1]*h_screen/100
+		first = 1 if self.args.abscissa else 0
 
-			self.x = int( max( 0, w_screen*self.args.x_pos/100 - self.w/2 ) )
-			self.y = int( max( 0, h_screen*self.args.y_pos/100 - self.h/2 ) )
+		if source.path is None :
+			return [ None ]*first + [ _Pyramid( serie ) for serie in data[first:] ]
 
-			if fig_manager is not None :
-				try :
-					if self.backend == 'TkAgg' :
-						fig_manager.window.geometry( '%+i%+i' % ( self.x, self.y ) )
-					else :
-						fig_manager.window.move( self.x, self.y )
-				except :
-					sys.stderr.write( self.progname + ": error: unable to move the window\n" )
+		directory, name = os.path.split( source.path )
+		cache = os.path.join( directory, '.' + name + '.tracer-lod' )
+		status = os.fstat( source.fd )
+		header = [ self.PYRAMID_MAGIC, status.st_size, status.st_mtime_ns, len( data[0] ) ] + source.indexes.tolist()
+		bounds = np.array( [ serie[0] for serie in data ] + [ serie[-1] for serie in data ], np.float64 )
 
-		if fig_manager is not None :
-			try :
-				if self.backend == 'TkAgg' :
-					fig_manager.window.geometry( '%ix%i' % ( self.w, self.h ) )
-				else :
-					fig_manager.window.resize( self.w, self.h )
-			except :
-				sys.stderr.write( self.progname + ": error: unable to resize the window\n" )
+		try :
+			with np.load( cache ) as arrays :
+				if arrays['header'].tolist() == header and np.array_equal( arrays['bounds'], bounds, equal_nan=True ) :
+					return [ None ]*first + [ _Pyramid( levels=[ tuple( arrays['%s_%i_%i' % ( key, i, l )] for key in ( 'min', 'max', 'argmin', 'argmax' ) )
+					                                             for l in range( arrays['levels'][i] ) ] ) for i in range( first, len( data ) ) ]
+		except ( IOError, ValueError, KeyError ) :
+			pass
 
+		pyramids = [ None ]*first + [ _Pyramid( serie ) for serie in data[first:] ]
 
-	def _linestyle( self, i ) :
-		if self.args.dashed is not None and i in self.args.dashed :
-			return '--'
-		elif self.args.dotted is not None and i in self.args.dotted :
-			return ':'
-		elif self.args.mixed is not None and i in self.args.mixed :
-			return '-.'
+		arrays = { 'header': np.array( header, np.int64 ), 'bounds': bounds,
+		           'levels': np.array( [ len( pyramid.levels ) if pyramid is not None else 0 for pyramid in pyramids ] ) }
+		for i, pyramid in enumerate( pyramids[first:], first ) :
+			for l, level in enumerate( pyramid.levels ) :
+				for key, array in zip( ( 'min', 'max', 'argmin', 'argmax' ), level ) :
+					arrays['%s_%i_%i' % ( key, i, l )] = array
+		try :
+			with open( cache + '.tmp', 'wb' ) as f :
+				np.savez( f, **arrays )
+			os.replace( cache + '.tmp', cache )
+		except OSError :
+			pass
+
+		return pyramids
+
+
+	def _seek_offset( self, source ) :
+		"Skip the offset lines or records of the memory-mapped file of a source and write them on the standard output unless quiet is set."
+
+		if self.args.binary is not None :
+			position = min( source.offset*self.args.binary.itemsize, len( source.mmap ) )
+			remaining = 0
 		else :
-			return '-'
+			index = self._line_index( source )
+			entry = min( source.offset//self.INDEX_STEP, len( index ) )
+			position = index[entry-1] if entry > 0 else 0
+			remaining = source.offset - entry*self.INDEX_STEP
+
+		while remaining > 0 and position < len( source.mmap ) :
+			count = min( self.INDEX_CHUNK, len( source.mmap ) - position )
+			ends = np.flatnonzero( np.frombuffer( source.mmap, np.uint8, count, position ) == 10 )
+			if len( ends ) >= remaining :
+				count = ends[remaining-1] + 1
+				remaining = 0
+			else :
+				remaining -= len( ends )
+			position += count
+			del ends
 
+		source.offset = 0
 
-	def _legend( self, i, series, n_end ) :
+		if not self.args.quiet and position > 0 :
+			sys.stdout.flush()
+			sent = 0
+			try :
+				while sent < position :
+					sent += os.sendfile( sys.stdout.fileno(), source.fd, sent, position - sent )
+			except OSError :
+				for start in range( sent, position, self.INDEX_CHUNK ) :
+					_write_out( [ source.mmap[start:min( position, start + self.INDEX_CHUNK )] ] )
 
-		n_start = n_end - len( series )
-		n_labels = max( 0, len( self.args.labels ) - n_start )
-		labels = self.args.labels[n_start:n_start+n_labels] + series[n_labels:]
+		source.position = position
 
-		leg = self.axes[i].legend( self._lines[n_start-( 1 if self.args.abscissa else 0 ):n_end], labels, frameon=self.args.plain )
-		for text in leg.get_texts() :
-			text.set_color( self.legends_color )
-		self.axes[i].xaxis.label.set_color( self.labels_color )
 
+	def _read_file_block( self, source ) :
+		"Return the next block of complete lines or records of the memory-mapped file of a source."
 
-	def _zero_sight( self ) :
+		start = source.position
+		if start >= len( source.mmap ) :
+			return b''
 
-		n = -1 if self.args.abscissa else 0
-		for i, ax in enumerate( self.axes ) :
-			if self.args.zero is not None and ( self.args.zero[0] == 0 or i + 1 in self.args.zero ) :
-				ax.relim()
-				n += len( self._series[i] )
-			else :
-				first = True
-				for serie in self._series[i] :
-					if n >= 0 :
-						ax.dataLim.update_from_path( self._lines[n].get_path(), first )
-						first = False
-					n += 1
-			ax.autoscale( True )
+		if self.args.binary is not None :
+			end = start + max( 1, self.chunk_size//self.args.binary.itemsize )*self.args.binary.itemsize
+			if end > len( source.mmap ) :
+				end = len( source.mmap ) - ( len( source.mmap ) - start )%self.args.binary.itemsize
+				if end == start :
+					return b''
+		else :
+			end = source.mmap.find( b'\n', start + self.chunk_size - 1 ) + 1
+			if end == 0 :
+				end = len( source.mmap )
 
+		source.position = end
+		return source.mmap[start:end]
 
-	def _plot_data( self ) :
 
-		if self.args.titles is None :
-			self.axes[0].set_title( '[ %i ]' % self._data_count )
+	def _read_file( self, source ) :
+		"Read the memory-mapped file of a source until its end or until the band is full."
 
-		n = 0
-		if self.args.abscissa :
-			for i, subplot in enumerate( self._series ) :
-				if i and not self.args.loop :
-					self.axes[i]._get_lines.prop_cycler = self.axes[i-1]._get_lines.prop_cycler
-				for serie in subplot :
-					if n :
-						self._lines += self.axes[i].plot( self._data[0], self._data[n], ls=self._linestyle( n ) )
-						if self.args.linewidth is not None and len( self.args.linewidth ) >= n :
-							self._lines[n-1].set_linewidth( self.args.linewidth[n-1] )
-						else :
-							self._lines[n-1].set_linewidth( self.lines_width )
-					n += 1
-				shift = 0 if i else 1
-				if len( subplot ) > shift + 1 :
-					self._legend( i, subplot[shift:], n )
-				elif len( self.args.labels ) > n - 1 :
-					self.axes[i].set_ylabel( self.args.labels[n-1], color=self.labels_color )
-				else :
-					self.axes[i].set_ylabel( subplot[shift], color=self.labels_color )
-			if len( self.args.labels ) > 0 :
-				self.axes[i].set_xlabel( self.args.labels[0], color=self.labels_color )
-			else :
-				self.axes[i].set_xlabel( self._series[0][0], color=self.labels_color )
-				
+		if os.fstat( source.fd ).st_size > 0 :
+			source.mmap = mmap.mmap( source.fd, 0, access=mmap.ACCESS_READ )
+		else :
+			source.mmap = b''
+		source.position = 0
+		if source.offset is not None :
+			self._seek_offset( source )
+
+		while True :
+			block = self._read_file_block( source )
+
+			if not block :
+				break
+
+			rows = self._parse( source, block, self.args.band - self._stored( source ) if self.args.band is not None else None )
+
+			if rows is not None and len( rows ) > 0 :
+				self._append( source, rows )
+
+			if self.args.band is not None and self._stored( source ) >= self.args.band :
+				break
+
+		self._set_ended( source )
+		self._notify( ( 'ended', self._sources.index( source ) ) )
+		self._publish()
+
+		if source.series is None :
+			sys.stderr.write( "No data were found in %s !\n" % source.name )
+
+
+	def _append( self, source, rows ) :
+		"Append new data to the store of a source, or to those of the figures fed by this tracer, and publish them to the thread of the GUI."
+
+		self._acquire()
+		if self._figures :
+			k = self._sources.index( source )
+			for figure in self._figures :
+				figure._extend( figure._sources[k], rows )
 		else :
-			for i, subplot in enumerate( self._series ) :
-				if i and not self.args.loop :
-					self.axes[i]._get_lines.prop_cycler = self.axes[i-1]._get_lines.prop_cycler
-				for serie in subplot :
-					self._lines += self.axes[i].plot( self._data[n], ls=self._linestyle( n + 1 ) )
-					if self.args.linewidth is not None and len( self.args.linewidth ) > n :
-						self._lines[n].set_linewidth( self.args.linewidth[n] )
-					else :
-						self._lines[n].set_linewidth( self.lines_width )
-					n += 1
-				if len( subplot ) > 1 :
-					self._legend( i, subplot, n )
-				elif len( self.args.labels ) > n - 1 :
-					self.axes[i].set_ylabel( self.args.labels[n-1], color=self.labels_color )
-				else :
-					self.axes[i].set_ylabel( subplot[0], color=self.labels_color )
-			if self.args.xlabel is not None :
-				self.axes[i].set_xlabel( self.args.xlabel, color=self.labels_color )
-			else :
-				self.axes[i].xaxis.label.set_color( self.labels_color )
+			self._extend( source, rows )
+		self._publish()
+		self._data_mutex.release()
 
-			self._zero_sight()
 
+	def _extend( self, source, rows ) :
+		"Append new data to the store of a source, keeping only its own series and no more data from a file than the band."
 
-	def _relim_data( self ) :
+		if source.selection is not None :
+			rows = rows[:,source.selection]
+		if source.fromfile and self.args.band is not None :
+			rows = rows[:max( 0, self.args.band - len( source.store ) )]
+		source.store.extend( rows, time.monotonic() - self._origin if source.stamped else None )
+		self._relim_data()
 
-		if self.args.band is not None and self._data_count > self.args.band :
-			for i in range( self._nseries ) :
-				del self._data[i][0:self._data_count-self.args.band]
 
-			self._data_count = self.args.band
+	def _stored( self, source ) :
+		"Return the amount of data kept from a source, by the fullest of the figures fed by this tracer if any."
 
+		if self._figures :
+			k = self._sources.index( source )
+			return max( len( figure._sources[k].store ) if figure._sources[k].store is not None else 0 for figure in self._figures )
+		return len( source.store ) if source.store is not None else 0
 
-	def redraw_data( self, msg='' ) :
-		"""
-		Update the figure from the read data.
 
-		The string as argument is written on top of the number of data if no title has been specified.
+	def _set_ended( self, source ) :
+		"Mark a source as ended, along with its counterparts in the figures fed by this tracer."
+
+		k = self._sources.index( source )
+		for tracer in [ self ] + self._figures :
+			tracer._sources[k].ended = True
+
+
+	def _publish( self ) :
+		"""
+		Increment the generation counter, which the worker shares with the GUI process,
+		along with those of the figures fed by this tracer, which are told the end of the inputs.
 		"""
 
-		if self.args.titles is None :
-			self.axes[0].set_title( '%s\n[ %i ]' % ( msg, self._data_count ) )
+		self._generation += 1
+		if self._worker == 0 :
+			self._shared[0] = self._generation
 
-		if self._new_data :
-			if self.args.abscissa :
-				for i in range( 1, self._nseries ) :
-					self._lines[i-1].set_xdata( self._data[0] )
-					self._lines[i-1].set_ydata( self._data[i] )
+		for figure in self._figures :
+			figure._ended = self._ended
+			figure._publish()
 
-			else :
-				for i in range( self._nseries ) :
-					self._lines[i].set_xdata( range( self._data_count ) )
-					self._lines[i].set_ydata( self._data[i] )
 
-			self._zero_sight()
+	def _notify( self, message ) :
+		"Send a message to the GUI process if this is the worker."
 
-			self._new_data = False
+		if self._worker == 0 :
+			try :
+				self._control.send( message )
+			except OSError :
+				self._stop_worker()
 
-			self.fig.canvas.toolbar.update()
-			self.fig.canvas.toolbar.push_current()
+
+	def _on_control( self ) :
+		"Apply the band sent by the GUI process to the worker, which stops when the pipe is closed."
 
 		try :
-			self.fig.canvas.draw_idle()
-		except RuntimeError :
-			pass
+			while self._control.poll() :
+				self.args.band = self._control.recv()
+		except ( EOFError, OSError ) :
+			self._stop_worker()
 
+		self._acquire()
+		self._relim_data()
+		self._publish()
+		self._data_mutex.release()
 
-	def _readline( self ) :
-		line = ''
-		c = os.read( self.input.fileno(), 1 ).decode( 'utf-8' )
-		if c :
-			while c != '\n' :
-				if not self._poll.poll( self.args.rate*1e3 ) == [] :
-					line += c
-					c = os.read( self.input.fileno(), 1 ).decode( 'utf-8' )
-				elif self._new_data and not self._paused :
-					self._warning = ''
-					self._top_time = time.time()
-					self._data_mutex.acquire()
-					self._relim_data()
-					self.redraw_data( self._warning )
-					self._data_mutex.release()
-			line += '\n'
-		return line
 
+	def _read_data( self ) :
+		"""
+		Read all the inputs, the regular files first and then the streams,
+		which are watched together by a single selector so that an idle input costs nothing.
 
-	def _end( self ) :
-		if self._data_count == 0 :
-			self.redraw_data( 'ENDED WITH NO DATA' )
-		else :
-			self._relim_data()
-			self.redraw_data( 'ENDED' )
+		The connections accepted by the listening sources are added to the selector
+		and removed when their producers disconnect, while the data they fed remain.
 
+		Nothing is drawn from this thread: the new data are only appended to the stores.
+		"""
 
-	def _read_data( self ) :
+		import selectors
+		import socket
 
-		self._new_data = False
-		self._warning = ''
-		self._top_time = time.time()
+		selector = selectors.DefaultSelector()
 
-		self._data_mutex.acquire()
+		for source in self._sources :
+			if source.fromfile :
+				self._read_file( source )
+			elif source.listening is not None :
+				selector.register( source.fd, selectors.EVENT_READ, source )
+			else :
+				selector.register( source.fd, selectors.EVENT_READ, _Connection( source.fd, source ) )
 
-		while True :
-			self._data_mutex.release()
+		if self._fromfile and all( source.series is None for source in self._sources ) :
+			os.kill( os.getpid(), signal.SIGTERM )
 
+		if self._worker == 0 :
+			selector.register( self._control.fileno(), selectors.EVENT_READ, self._control )
 
-			# SYNCHRONISATION AVEC LES DONNÉES :
+		while len( selector.get_map() ) > ( 1 if self._worker == 0 else 0 ) :
 
-			if self._fromfile :
-				strline = self.input.readline()
 
-			else :
-				try :
-					strline = self._readline()
-				except OSError :
-					uptodate = True
-					timeout = self._poll.poll( self.args.rate*1e3 ) == []
-				else :
-					uptodate = False
-					timeout = False
-
-				if timeout and self._new_data and not self._paused :
-					self._warning = ''
-					self._top_time = time.time()
-					self._data_mutex.acquire()
-					self._relim_data()
-					self.redraw_data( self._warning )
-					continue
-				elif timeout :
-					self._data_mutex.acquire()
-					continue
-				elif uptodate :
-					strline = self._readline()
+			# SYNCHRONISATION AVEC LES DONNÉES :
 
+			events = selector.select( 0 )
+			if not events :
+				for tracer in [ self ] + self._figures :
+					tracer._caught_up = True
+				self._counters[5] += 1
+				events = selector.select()
 
-			# LECTURE D'UNE NOUVELLE LIGNE :
 
-			if not strline :
-				break
+			# LECTURE DES NOUVELLES LIGNES :
 
-			self._data_mutex.acquire()
+			for key, mask in events :
 
-			line = strline.split( self.args.sep )
-			
-			if self.args.offset is not None and self.args.offset > 0 :
-				self.args.offset -= 1
-				if not self.args.quiet :
-					sys.stdout.write( strline )
-				continue
+				if key.data is self._control :
+					self._on_control()
+					continue
 
-			if self.args.ncolumns is not None and len( line ) != self.args.ncolumns :
-				if not self.args.quiet :
-					sys.stdout.write( strline )
-				continue
-			
-			if self._series is None :
+				if isinstance( key.data, _Source ) :
+					source = key.data
+					try :
+						if source.listening == socket.SOCK_DGRAM :
+							block = self._read_datagram( source )
+						else :
+							sock, address = source.file.accept()
+							sock.setblocking( False )
+							selector.register( sock.fileno(), selectors.EVENT_READ, _Connection( sock.fileno(), source, sock ) )
+							continue
+					except OSError :
+						continue
 
-				self._series = [[]]
-				for i, word in enumerate( line ) :
+				else :
+					connection = key.data
+					source = connection.source
 					try :
-						line[i] = float( word )
-					except ValueError :
+						if self.args.overload == 'drop-oldest' :
+							self._skip_to_newest( connection )
+						block = self._read_block( connection )
+					except OSError :
 						continue
-					self._series[0].append( i + 1 )
 
-				self._nseries = len( self._series[0] )
-				if ( not self.args.abscissa and self._nseries < 1 ) or ( self.args.abscissa and self._nseries < 2 ) :
-					self._series = None
-					if not self.args.quiet :
-						sys.stdout.write( strline )
-					continue
+					if block is None :
+						selector.unregister( connection.fd )
+						if connection.socket is not None :
+							connection.socket.close()
+						else :
+							self._set_ended( source )
+						continue
 
-				self._seriesmax = max( self._series[0] )
-				self._data = [ [] for i in self._series[0] ]
+					if self.args.overload in ( 'decimate', 'aggregate' ) :
+						self._adapt_shedding( source, connection.fd )
 
-				if not self._fromfile :
-					self._plot_data()
+				if not block :
+					continue
 
-			else :
+				echo = True
+				if self.args.overload == 'decimate' and source.shedding > 1 :
+					# LES LIGNES ÉCARTÉES SONT TOUT DE MÊME RECOPIÉES SUR LA SORTIE STANDARD :
+					if self.args.reprint :
+						_write_out( [ block ] )
+						echo = False
+					block = self._decimate_block( source, block )
 
-				if len( line ) < self._seriesmax :
-					if not self.args.quiet :
-						sys.stdout.write( strline )
-					continue
+				rows = self._parse( source, block, echo=echo )
 
-				try :
-					for subplot in self._series :
-						for serie in subplot :
-							index = serie - 1 if serie > 0 else serie
-							line[index] = float( line[index] )
-				except ValueError :
-					if not self.args.quiet :
-						sys.stdout.write( strline )
+				if rows is None or len( rows ) == 0 :
 					continue
-			
-			if self.args.reprint :
-				sys.stdout.write( strline )
-
-			sys.stdout.flush()
 
+				if self.args.overload == 'aggregate' and source.shedding > 3 :
+					rows = self._aggregate( source, rows )
 
-			# AJOUT DES NOUVELLES DONNÉES :
 
-			n = 0
-			for i, subplot in enumerate( self._series ) :
-				for j, serie in enumerate( subplot ) :
-					index = serie - 1 if serie > 0 else serie
-					self._data[n].append( line[index] )
-					n += 1
-			
-			self._data_count += 1
-			self._new_data = True
+				# AJOUT DES NOUVELLES DONNÉES :
 
-			if self._fromfile :
-				if self.args.band is not None and self._data_count >= self.args.band :
-					break
-				continue
+				self._append( source, rows )
 
-			elif time.time() - self._top_time >= self.args.rate :
-				if uptodate :
-					self._top_time = time.time()
-					self._relim_data()
-					if not self._paused :
-						self.redraw_data( self._warning )
-					self._warning = ''
-				else :
-					self._warning = 'OVERRUN'
+		selector.close()
 
 
 		# FIN DES DONNÉES :
 
-		self._ended = True
+		for source in self._sources :
+			if source.archive is not None :
+				source.archive.close()
 
-		if self._fromfile :
-			if self._series is not None :
-				self._plot_data()
-			else :
-				sys.stderr.write( "No data were found in %s !\n" % self.args.file.name )
-				os.kill( os.getpid(), signal.SIGTERM )
-		elif not self._paused :
-			self._end()
+		self._ended = True
+		self._notify( ( 'end', ) )
+		self._publish()
 
 
 	def pause( self ) :
@@ -816,6 +3214,7 @@ class Tracer :
 		if self._ended :
 			if self._paused :
 				self._paused = False
+				self._release_backups()
 				self._end()
 			return
 
@@ -826,17 +3225,95 @@ class Tracer :
 			return
 
 		if self._paused :
-			self._data_mutex.acquire()
-			self._relim_data()
-			self._data_count_backup = self._data_count
-			self._data_backup = copy.deepcopy( self._data )
+			self._take_backups()
+			self._new_data = True
 			self.redraw_data( 'PAUSED' )
-			self._data_mutex.release()
 		else :
-			self._data_mutex.acquire()
-			self._relim_data()
+			self._release_backups()
+			self._new_data = True
 			self.redraw_data( '' )
-			self._data_mutex.release()
+
+
+	def _take_backups( self ) :
+		"Keep the data of the moment of the pause, along with the number of data archived before them."
+
+		for source in self._sources :
+			if source.store is not None :
+				source.backup, source.limits_backup, source.sorted_backup, evicted = self._snapshot( source, evicted=True )
+				if source.archive is not None :
+					source.history = evicted, source.backup, source.limits_backup, source.sorted_backup
+		self._history_offset = 0
+
+
+	def _release_backups( self ) :
+
+		for source in self._sources :
+			source.backup = None
+			source.history = None
+
+
+	def scroll_history( self, pages ) :
+		"""
+		Move the view through the whole history of the inputs kept by --archive by half a band for each page,
+		back in time if 'pages' is negative, which pauses the drawing.
+
+		Only the chunks of the archive covered by the view are read, and scrolling forward stops at the moment of the pause.
+		"""
+
+		if self.args.archive is None or self._data_count == 0 :
+			return
+
+		if not self._paused :
+			self._paused = True
+			self._take_backups()
+
+		histories = [ source for source in self._sources if source.history is not None ]
+		if not histories :
+			return
+
+		lengths = [ source.history[0] + len( source.history[1][0] ) for source in histories ]
+		page = self.args.band if self.args.band is not None else max( lengths )
+		offset = self._history_offset - pages*max( 1, page//2 )
+		self._history_offset = min( max( 0, offset ), max( 0, max( lengths ) - page ) )
+
+
+		# LECTURE DE LA PORTION D'HISTORIQUE :
+
+		for source, length in zip( histories, lengths ) :
+
+			evicted, data, limits, ordered = source.history
+
+			if self._history_offset == 0 :
+				source.backup, source.limits_backup, source.sorted_backup = data, limits, ordered
+				continue
+
+			stop = max( length - self._history_offset, min( page, length ) )
+			start = max( 0, stop - page )
+
+			parts = []
+			if start < evicted :
+				parts.append( source.archive.read( start, min( stop, evicted ) ) )
+			if stop > evicted :
+				parts.append( np.array( [ serie[max( start - evicted, 0 ):stop - evicted] for serie in data ] ) )
+			portion = np.concatenate( parts, axis=1 )
+			portion.flags.writeable = False
+
+			source.backup = list( portion )
+			source.sorted_backup = bool( np.all( portion[0][1:] >= portion[0][:-1] ) )
+			source.limits_backup = []
+			for serie in portion :
+				numbers = serie[serie == serie]
+				source.limits_backup.append( ( numbers.min(), numbers.max() ) if len( numbers ) > 0 else None )
+
+		self._new_data = True
+		self.redraw_data( 'HISTORY -%i' % self._history_offset if self._history_offset > 0 else 'PAUSED' )
+
+
+	def _on_scroll( self, event ) :
+		"Scroll the view back through the history when the mouse wheel is turned down over an axes."
+
+		if event.inaxes is not None :
+			self.scroll_history( int( event.step ) )
 
 
 	def is_paused( self ) :
@@ -846,51 +3323,64 @@ class Tracer :
 
 
 	def is_ended( self ) :
-		"Return True if the EOF has been reached."
+		"Return True if the EOF has been reached on every input."
 
 		return self._ended
 
 
 	def is_fromfile( self ) :
-		"Return True if reading from a regular file."
+		"Return True if reading only from regular files."
 
 		return self._fromfile
 
 	
 	def get_series( self ) :
-		"Return the list of series grouped by subplots."
+		"Return the list of series grouped by subplots, following the order of the inputs."
+
+		series = [ subplot for source in self._sources if source.series is not None for subplot in source.series ]
+		return copy.deepcopy( series ) if series else None
+
+
+	def get_figures( self ) :
+		"Return the tracers of the figures given by --figure, or this tracer alone if there are none."
+
+		return list( self._figures ) if self._figures else [ self ]
 
-		return copy.deepcopy( self._series )
+
+	def sources_count( self ) :
+		"Return the number of inputs."
+
+		return len( self._sources )
 
 
 	def data_count( self ) :
-		"Return the current data length."
+		"Return the current data length of the longest input."
 
 		return self._data_count
 
 	
-	def get_data( self ) :
+	def get_data( self, source=0 ) :
 		"""
-		Return the data length and the data list.
+		Return the data length and the data list of the input numbered 'source'.
 		If the reading is paused, these are from the moment of the pause.
 
-		The data list is composed by a list of floats for each series.
+		The data list is composed by a read-only array of floats for each series,
+		which is a view on the data that the reading never overwrites.
 		"""
 
-		if self._data_count == 0 :
-			return 0, None
+		source = self._sources[source]
 
-		if not self._paused :
+		if self._paused :
+			if source.backup is None or len( source.backup[0] ) == 0 :
+				return 0, None
+			return len( source.backup[0] ), source.backup
 
-			if self._ended :
-				return self._data_count, self._data
+		if source.store is None or len( source.store ) == 0 :
+			return 0, None
 
-			self._data_mutex.acquire()
-			self._data_count_backup = self._data_count
-			self._data_backup = copy.deepcopy( self._data )
-			self._data_mutex.release()
+		data, limits, ordered = self._snapshot( source )
 
-		return self._data_count_backup, self._data_backup
+		return len( data[0] ), data
 
 
 def import_TracerToolbar( NavigationToolbar2 ) :
@@ -907,7 +3397,8 @@ def import_TracerToolbar( NavigationToolbar2 ) :
 		                   or FigureCanvasTkAgg from matplotlib.backends.backend_tkagg for examples).
 		A window from whatever window manager.
 		A TracerToolbar instance.
-		A function (or None) which has to return a file object for saving data whenever it is called.
+		A function (or None) which has to return a file object for saving data whenever it is called,
+		preferably opened in binary mode, whose extension selects the format as described for write_data.
 		A function (or None) which takes the current band and rate as arguments and has to return new ones.
 		False if the messages should not be printed in the toolbar (Qt only).
 
@@ -916,6 +3407,7 @@ def import_TracerToolbar( NavigationToolbar2 ) :
 		'b' to switch to the band/rate tool.
 		'd' to save the data.
 		'a' to toggle the displaying of the abscissa.
+		'i' to toggle the overlay of the performance counters.
 	"""
 
 	try :
@@ -970,6 +3462,8 @@ def import_TracerToolbar( NavigationToolbar2 ) :
 			self.band_bak = tracer.args.band
 			self.rate_bak = tracer.args.rate
 
+			self._saving = None
+
 			self.update_message()
 
 			self.band_sensi = lambda x: ( x*5e-2 )**3
@@ -984,6 +3478,8 @@ def import_TracerToolbar( NavigationToolbar2 ) :
 				self.band()
 			elif event.key == 'd' :
 				self.save_data()
+			elif event.key == 'i' :
+				self.tracer.toggle_stats()
 			elif event.key == 'a' :
 				event.inaxes.abscissa.set_visible( not event.inaxes.abscissa.get_visible() )
 				self.canvas.draw()
@@ -1147,28 +3643,396 @@ def import_TracerToolbar( NavigationToolbar2 ) :
 
 		def save_data( self ) :
 
+			import threading
+
 			if self.get_save_file is not None :
-				n, data = self.tracer.get_data()
-				if n > 0 :
+				if self._saving is not None :
+					self.set_message( 'saving data : %i %%' % ( 100*self._save_progress ) )
+					return
+				datasets = [ self.tracer.get_data( k ) for k in range( self.tracer.sources_count() ) ]
+				if any( n > 0 for n, data in datasets ) :
 					f = self.get_save_file()
 					if hasattr( f, 'write' ) :
-						s = len( data )
-						for i in range( n ) :
-							line = ''
-							for j in range( s - 1 ) :
-								line += str( data[j][i] ) + ' '
-							line += str( data[s-1][i] ) + '\n'
-							f.write( line )
-						if hasattr( f, 'close' ) :
-							f.close()
+						self._save_progress = 0.
+						self._save_error = None
+						self._saving = threading.Thread( target=self._save, args=( f, datasets ) )
+						self._saving.daemon = True
+						self._saving.start()
+						self._save_timer = self.canvas.new_timer( interval=200 )
+						self._save_timer.add_callback( self._on_save_timer )
+						self._save_timer.start()
 				else :
 					self.set_message( 'no data to save' )
 
 
+		def _save( self, f, datasets ) :
+
+			def progress( fraction ) :
+				self._save_progress = fraction
+
+			try :
+				write_data( f, datasets, progress )
+			except ( IOError, ValueError ) as e :
+				self._save_error = e
+			finally :
+				if hasattr( f, 'close' ) :
+					f.close()
+
+
+		def _on_save_timer( self ) :
+
+			if self._saving.is_alive() :
+				self.set_message( 'saving data : %i %%' % ( 100*self._save_progress ) )
+				return
+
+			self._save_timer.stop()
+			self._saving = None
+
+			if self._save_error is not None :
+				self.set_message( 'unable to save the data : %s' % ( getattr( self._save_error, 'strerror', None ) or self._save_error ) )
+			else :
+				self.set_message( 'data saved' )
+
+
 	return TracerToolbar
 
 
+def write_data( f, datasets, progress=None ) :
+	"""
+	Write the datasets returned by Tracer.get_data for each input into the file object f,
+	in a format chosen from the extension of its name :
+		'.npy' for an array with one column per series for each input, stored one after the other.
+		'.npz' for an archive with such an array for each input, named 'input0', 'input1', etc.
+		'.raw' or '.bin' for little-endian float64 in rows, preceded for each input by a header made of the string 'TRACER64'
+		       followed by the number of data and the number of series as little-endian 64 and 32-bit unsigned integers.
+		Otherwise text with one line per data and an empty line between the inputs.
+
+	The text is formatted a block of lines at once. If specified, 'progress' is called with the fraction of data written.
+	"""
+
+	name = getattr( f, 'name', None )
+	extension = os.path.splitext( name )[1].lower() if isinstance( name, str ) else ''
+
+	if hasattr( f, 'buffer' ) :
+		f.flush()
+		f = f.buffer
+
+	total = max( 1, sum( n for n, data in datasets ) )
+	written = 0
+	block = 65536
+
+	if extension == '.npz' :
+		np.savez( f, **{ 'input%i' % k : np.column_stack( data ) if n > 0 else np.empty( ( 0, 0 ) ) for k, ( n, data ) in enumerate( datasets ) } )
+
+	elif extension == '.npy' :
+		for n, data in datasets :
+			np.save( f, np.column_stack( data ) if n > 0 else np.empty( ( 0, 0 ) ) )
+			written += n
+			if progress is not None :
+				progress( written/total )
+
+	else :
+		for k, ( n, data ) in enumerate( datasets ) :
+
+			if extension in ( '.raw', '.bin' ) :
+				f.write( b'TRACER64' + struct.pack( '<QI', n, len( data ) if n > 0 else 0 ) )
+			elif k > 0 :
+				f.write( b'\n' )
+
+			if n == 0 :
+				continue
+
+			line = ' '.join( [ '%r' if data[0].dtype == np.float64 else '%.9g' ]*len( data ) ) + '\n'
+
+			for start in range( 0, n, block ) :
+				rows = np.column_stack( [ serie[start:start+block] for serie in data ] )
+				if extension in ( '.raw', '.bin' ) :
+					f.write( rows.astype( '<f8' ).tobytes() )
+				else :
+					f.write( ( line*len( rows ) % tuple( rows.ravel().tolist() ) ).encode( 'utf-8' ) )
+				written += len( rows )
+				if progress is not None :
+					progress( written/total )
+
+
+# VARIABLES D'ENVIRONNEMENT TRANSMISES AU DÉMON, EN PLUS DE CELLES DES LOCALES (LC_*) :
+_DAEMON_ENVIRON = ( 'DISPLAY', 'XAUTHORITY', 'WAYLAND_DISPLAY', 'TERM', 'LANG', 'LANGUAGE' )
+
+
+def _daemon_path() :
+	"Return the path of the Unix socket of the daemon of the current user, in a directory of its own."
+
+	return os.path.join( os.environ.get( 'XDG_RUNTIME_DIR' ) or '/tmp', 'tracer-%i' % os.getuid(), 'daemon.sock' )
+
+
+def _private_directory( directory ) :
+	"Return True if the directory is a real directory owned by the current user and closed to the others."
+
+	try :
+		status = os.lstat( directory )
+	except OSError :
+		return False
+	return stat.S_ISDIR( status.st_mode ) and status.st_uid == os.getuid() and status.st_mode & 0o077 == 0
+
+
+def _peer_uid( sock ) :
+	"Return the user id of the process at the other end of a Unix socket, or None if it cannot be known."
+
+	import socket
+
+	if not hasattr( socket, 'SO_PEERCRED' ) :
+		return None
+	try :
+		return struct.unpack( '3i', sock.getsockopt( socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize( '3i' ) ) )[1]
+	except OSError :
+		return None
+
+
+def _daemon_environ( environ ) :
+	"Return the variables of an environment that are handed over to the daemon: those of the display, the terminal and the locales."
+
+	return { key : value for key, value in environ.items() if key in _DAEMON_ENVIRON or key.startswith( 'LC_' ) }
+
+
+def _recv_exactly( sock, size ) :
+
+	data = b''
+	while len( data ) < size :
+		chunk = sock.recv( size - len( data ) )
+		if not chunk :
+			raise EOFError
+		data += chunk
+	return data
+
+
+def serve( path=None ) :
+	"""
+	Run the daemon which keeps the interpreter and Matplotlib loaded and listens on a Unix socket
+	for the calls of the program, which hand over their arguments and their standard streams.
+
+	A process is forked for each call to create its window and to send back its pid and then its exit status,
+	so that every window behaves as a separate tracer.
+
+	The socket is created in a directory that only the current user can access,
+	and the calls from the processes of other users are refused.
+	"""
+
+	import socket
+
+	if path is None :
+		path = _daemon_path()
+
+	directory = os.path.dirname( path )
+	try :
+		os.mkdir( directory, 0o700 )
+	except FileExistsError :
+		pass
+	except OSError as e :
+		sys.stderr.write( "Unable to create %s: %s\n" % ( directory, e.strerror ) )
+		return 1
+	if not _private_directory( directory ) :
+		sys.stderr.write( "%s must be a directory owned by the current user and closed to the others\n" % directory )
+		return 1
+
+
+	# PRÉCHARGEMENT :
+
+	import matplotlib
+	import matplotlib.pyplot
+	from matplotlib.figure import Figure
+	from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+	matplotlib.get_backend()
+	FigureCanvasAgg( Figure() ).draw()
+	if os.environ.get( 'DISPLAY' ) :
+		try :
+			_screen_size()
+		except :
+			pass
+
+
+	# OUVERTURE DU SOCKET :
+
+	server = socket.socket( socket.AF_UNIX, socket.SOCK_STREAM )
+	try :
+		server.connect( path )
+		sys.stderr.write( "A daemon is already listening on %s\n" % path )
+		return 1
+	except OSError :
+		pass
+	server.close()
+
+	try :
+		os.unlink( path )
+	except OSError :
+		pass
+
+	server = socket.socket( socket.AF_UNIX, socket.SOCK_STREAM )
+	server.bind( path )
+	os.chmod( path, 0o600 )
+	server.listen( socket.SOMAXCONN )
+
+	def stop_handler( signum, frame ) :
+		raise KeyboardInterrupt
+
+	signal.signal( signal.SIGCHLD, signal.SIG_IGN )
+	signal.signal( signal.SIGINT, stop_handler )
+	signal.signal( signal.SIGTERM, stop_handler )
+
+	sys.stderr.write( "Listening on %s\n" % path )
+	sys.stderr.flush()
+
+
+	# TRAITEMENT DES APPELS :
+
+	try :
+		while True :
+
+			connection, address = server.accept()
+
+			# UN CLIENT SILENCIEUX NE BLOQUE LES APPELS SUIVANTS QUE BRIÈVEMENT, LES SIENS ARRIVANT DÈS SA CONNEXION :
+			connection.settimeout( 0.5 )
+
+			if _peer_uid( connection ) != os.getuid() :
+				connection.close()
+				continue
+
+			fds = []
+			try :
+				header, fds, flags, address = socket.recv_fds( connection, 4, 3 )
+				if len( header ) != 4 or len( fds ) != 3 :
+					raise EOFError
+				call = json.loads( _recv_exactly( connection, struct.unpack( '!I', header )[0] ) )
+			except ( OSError, EOFError, ValueError ) :
+				connection.close()
+				for fd in fds :
+					os.close( fd )
+				continue
+
+			connection.settimeout( None )
+
+			if os.fork() == 0 :
+				server.close()
+				_serve_call( connection, call, fds )
+
+			for fd in fds :
+				os.close( fd )
+			connection.close()
+
+	except KeyboardInterrupt :
+		pass
+
+	finally :
+		server.close()
+		os.unlink( path )
+
+	return 0
+
+
+def _serve_call( connection, call, fds ) :
+	"Run a call handed over to the daemon in the forked process, as a tracer forked by run() would."
+
+	signal.signal( signal.SIGCHLD, signal.SIG_DFL )
+	signal.signal( signal.SIGTERM, signal.SIG_DFL )
+	signal.signal( signal.SIGINT, signal.SIG_IGN )
+	signal.signal( signal.SIGTSTP, signal.SIG_IGN )
+
+	for target, fd in enumerate( fds ) :
+		os.dup2( fd, target )
+		os.close( fd )
+
+	os.chdir( call['cwd'] )
+	for key in list( _daemon_environ( os.environ ) ) :
+		del os.environ[key]
+	os.environ.update( _daemon_environ( call['environ'] ) )
+	sys.argv = [ sys.argv[0] ] + call['argv']
+
+	connection.sendall( struct.pack( '!i', os.getpid() ) )
+
+	try :
+		status = Tracer().run( fork=False )
+	except SystemExit as e :
+		status = e.code if isinstance( e.code, int ) else 0 if e.code is None else 1
+	except :
+		import traceback
+		traceback.print_exc()
+		status = 1
+
+	try :
+		sys.stdout.flush()
+		sys.stderr.flush()
+		connection.sendall( struct.pack( '!i', status ) )
+	except OSError :
+		pass
+
+	_finish()
+	os._exit( status )
+
+
+def _hand_over( argv, path=None ) :
+	"""
+	Hand over a call to the daemon if one started by the current user is listening and wait for its window to be closed,
+	terminating it if the terminal sends an interruption.
+
+	Only a daemon listening in the private directory of the user and running as this user is trusted,
+	and it only receives the variables of the environment concerning the display, the terminal and the locales.
+
+	Return the exit status of the window or None if no daemon has taken the call.
+	"""
+
+	import socket
+
+	if path is None :
+		path = _daemon_path()
+
+	if not _private_directory( os.path.dirname( path ) ) :
+		return None
+
+	sock = socket.socket( socket.AF_UNIX, socket.SOCK_STREAM )
+	try :
+		sock.connect( path )
+		if _peer_uid( sock ) != os.getuid() :
+			raise EOFError
+		payload = json.dumps( { 'argv': argv, 'cwd': os.getcwd(), 'environ': _daemon_environ( os.environ ) } ).encode( 'utf-8' )
+		socket.send_fds( sock, [ struct.pack( '!I', len( payload ) ) ], [ 0, 1, 2 ] )
+		sock.sendall( payload )
+		pid = struct.unpack( '!i', _recv_exactly( sock, 4 ) )[0]
+		if pid <= 0 :
+			raise EOFError
+	except ( OSError, EOFError ) :
+		sock.close()
+		return None
+
+	interrupted = []
+
+	def ctrl_c_handler( signum, frame ) :
+		sys.stderr.write( '\r' )
+		interrupted.append( signum )
+		try :
+			os.kill( pid, signal.SIGTERM )
+		except OSError :
+			pass
+
+	signal.signal( signal.SIGINT, ctrl_c_handler )
+
+	try :
+		return struct.unpack( '!i', _recv_exactly( sock, 4 ) )[0]
+	except ( OSError, EOFError ) :
+		return 0 if interrupted else 1
+	finally :
+		sock.close()
+
+
 def main() :
+
+	if sys.argv[1:] == [ '--daemon' ] :
+		sys.exit( serve() )
+
+	if '--daemon' not in sys.argv[1:] :
+		status = _hand_over( sys.argv[1:] )
+		if status is not None :
+			sys.exit( status )
+
 	sys.exit( Tracer().run() )
 
 if __name__ == '__main__' :
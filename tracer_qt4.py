@@ -79,10 +79,10 @@ class QTracerWindow( QtGui.QMainWindow ) :
 
 	def save_window( self ) :
 
-		filename = QtGui.QFileDialog.getSaveFileName( self, 'File for data saving', os.getcwd(), 'Text or data files (*.txt *.dat)' )
+		filename = QtGui.QFileDialog.getSaveFileName( self, 'File for data saving', os.getcwd(), 'Text or data files (*.txt *.dat);;NumPy files (*.npy *.npz);;Raw float64 files (*.raw *.bin)' )
 		if filename :
 			try :
-				return open( filename, 'w' )
+				return open( filename, 'wb' )
 			except IOError as e :
 				QtGui.QMessageBox.critical( self, 'Error', 'Unable to open the file %s :\n%s' % ( filename, e.strerror ) )
 		return None
@@ -149,7 +149,7 @@ def main() :
 
 	app = QtGui.QApplication( sys.argv )
 
-	main_window = QTracerWindow( main_tracer )
+	app.windows = [ QTracerWindow( tracer ) for tracer in main_tracer.get_figures() ]
 
 	sys.exit( app.exec_() )
 
@@ -32,12 +32,18 @@ import os
 
 class TkTracerWindow() :
 
+	# NOMBRE DE FENÊTRES OUVERTES, L'APPLICATION S'ARRÊTANT À LA FERMETURE DE LA DERNIÈRE :
+	opened = 0
+
 	def __init__( self, window, tracer ) :
 
 		self.window = window
 
 		self.tracer = tracer
 
+		self.closed = False
+		TkTracerWindow.opened += 1
+
 		# PARAMÈTRES DE LA FENÊTRE :
 
 		window.title( self.tracer.window_title )
@@ -56,9 +62,8 @@ class TkTracerWindow() :
 
 		self.canvas.mpl_connect( 'key_press_event', self.on_key )
 
-		def destroy( *args ) :
-			self.window.quit()
-		self.canvas._tkcanvas.bind( "<Destroy>", destroy )
+		self.window.protocol( 'WM_DELETE_WINDOW', self.close )
+		self.canvas._tkcanvas.bind( "<Destroy>", self.close )
 
 		self.canvas.draw()
 
@@ -69,9 +74,30 @@ class TkTracerWindow() :
 			is_fullscreen = bool( self.window.attributes( '-fullscreen' ) )
 			self.window.attributes( '-fullscreen', not is_fullscreen )
 		elif event.key == 'ctrl+w' :
-			self.window.quit()
+			self.close()
 		else :
 			self.toolbar.tracer_key_handler( event )
+
+
+	def close( self, *args ) :
+		"Close only this window, the main one being hidden since the others belong to it, and stop the application with the last one."
+
+		if self.closed :
+			return
+		self.closed = True
+		TkTracerWindow.opened -= 1
+
+		# LA FENÊTRE EST DÉJÀ DÉTRUITE SI L'ÉVÉNEMENT <Destroy> EST REÇU :
+		root = self.window._root()
+		if args :
+			pass
+		elif self.window is root :
+			root.withdraw()
+		else :
+			self.window.destroy()
+
+		if TkTracerWindow.opened == 0 :
+			root.quit()
 	
 
 	def save_window( self ) :
@@ -79,7 +105,7 @@ class TkTracerWindow() :
 		filename = filedialog.asksaveasfilename( title='File for data saving', initialdir=os.getcwd() )
 		if filename :
 			try :
-				return open( filename, 'w' )
+				return open( filename, 'wb' )
 			except IOError as e :
 				messagebox.showerror( 'Error', 'Unable to open the file %s :\n%s' % ( filename, e.strerror ) )
 		return None
@@ -150,7 +176,9 @@ def main() :
 
 	app = tk.Tk()
 
-	main_window = TkTracerWindow( app, main_tracer )
+	figures = main_tracer.get_figures()
+	main_window = TkTracerWindow( app, figures[0] )
+	app.windows = [ main_window ] + [ TkTracerWindow( tk.Toplevel( app ), tracer ) for tracer in figures[1:] ]
 
 	app.mainloop()
 